@@ -67,6 +67,14 @@ function doPost(e) {
     // Parsear body
     const params = JSON.parse(e.postData.contents);
 
+    // Batch: varias llamadas en un solo request
+    if (Array.isArray(params.batch)) {
+      return jsonResponse({
+        success: true,
+        results: params.batch.map(routeBatchItem)
+      });
+    }
+
     // Validar servicio y acción
     if (!params.service || !params.action) {
       return errorResponse('Faltan parámetros: service y action son requeridos');
@@ -82,6 +90,20 @@ function doPost(e) {
   }
 }
 
+/**
+ * Ejecuta una llamada de un batch; los errores quedan en su propio resultado
+ */
+function routeBatchItem(params) {
+  try {
+    if (!params.service || !params.action) {
+      return { success: false, error: 'Faltan parámetros: service y action son requeridos' };
+    }
+    return routeRequest(params);
+  } catch (error) {
+    return { success: false, error: 'Error: ' + error.toString() };
+  }
+}
+
 // =============================================
 // ROUTER - DISTRIBUIDOR DE SERVICIOS
 // =============================================
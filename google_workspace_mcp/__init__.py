@@ -14,8 +14,23 @@ Supported services:
 
 __version__ = "0.2.0"
 
-# Export main servers
-from google_workspace_mcp.gogcli_server import server as gogcli_server
-from google_workspace_mcp.server import server as oauth_server
+# gogcli_mcp_server, not gogcli_server: that name is also the submodule's, and
+# once the submodule is imported (e.g. by the entry point) the import system
+# binds the module to it, so __getattr__ never runs
+__all__ = ["gogcli_mcp_server", "oauth_server"]
 
-__all__ = ["gogcli_server", "oauth_server"]
+
+def __getattr__(name: str):
+    """Import the servers lazily (PEP 562) so importing the package stays cheap"""
+    if name in ("gogcli_mcp_server", "gogcli_server"):
+        # gogcli_server is the old, ambiguous name, kept for existing callers
+        from google_workspace_mcp.gogcli_server import server as gogcli_mcp_server
+        # The import just bound the submodule to gogcli_server; cache the
+        # Server under both names over it
+        globals().update(gogcli_mcp_server=gogcli_mcp_server, gogcli_server=gogcli_mcp_server)
+        return gogcli_mcp_server
+    if name == "oauth_server":
+        from google_workspace_mcp.server import server as oauth_server
+        globals()[name] = oauth_server
+        return oauth_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
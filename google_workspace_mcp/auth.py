@@ -4,14 +4,17 @@ Google OAuth Authentication Handler
 Manages OAuth 2.0 flow for Google Workspace APIs.
 """
 
+import asyncio
+import logging
 import os
-import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
-from google.auth.transport.requests import Request
+import orjson
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+logger = logging.getLogger(__name__)
 
 # OAuth scopes for each service
 SCOPES = {
@@ -36,6 +39,13 @@ FULL_WORKSPACE_SCOPES = [
 TOKEN_FILE = "token.json"
 CREDENTIALS_FILE = "credentials.json"
 
+# Refresh access tokens this many seconds before they expire
+REFRESH_MARGIN = 300
+
+# Background refresh retries back off from the first delay up to the cap (seconds)
+REFRESH_RETRY_DELAY = 30
+REFRESH_RETRY_MAX_DELAY = 900
+
 
 class GoogleAuth:
     """Handles Google OAuth 2.0 authentication"""
@@ -66,29 +76,42 @@ class GoogleAuth:
         self.token_file = Path(token_file)
         self.credentials: Optional[Credentials] = None
 
+        # Serializes refreshes so concurrent callers don't each hit the token endpoint
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_margin = REFRESH_MARGIN
+        self._refresher_task: Optional[asyncio.Task] = None
+
     def _load_token(self) -> Optional[Credentials]:
         """Load token from file if it exists"""
-        if self.token_file.exists():
-            try:
-                with open(self.token_file, "r") as f:
-                    token_data = json.load(f)
-                return Credentials.from_authorized_user_info(token_data)
-            except Exception:
-                return None
-        return None
+        try:
+            data = self.token_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return Credentials.from_authorized_user_info(orjson.loads(data))
+        except Exception:
+            return None
 
     def _save_token(self, credentials: Credentials) -> None:
-        """Save token to file"""
+        """Save token to file (atomically, so a crash never leaves half a token)"""
         self.token_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.token_file, "w") as f:
-            json.dump({
-                "token": credentials.token,
-                "refresh_token": credentials.refresh_token,
-                "token_uri": credentials.token_uri,
-                "client_id": credentials.client_id,
-                "client_secret": credentials.client_secret,
-                "scopes": credentials.scopes,
-            }, f, indent=2)
+        data = {
+            "token": credentials.token,
+            "refresh_token": credentials.refresh_token,
+            "token_uri": credentials.token_uri,
+            "client_id": credentials.client_id,
+            "client_secret": credentials.client_secret,
+            "scopes": credentials.scopes,
+        }
+        tmp_file = self.token_file.with_suffix(".tmp")
+        # The token grants account access: create the file owner-only before
+        # any of it is written. A leftover from a crashed save is removed first,
+        # since opening an existing file would keep its old mode.
+        tmp_file.unlink(missing_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_file, self.token_file)
 
     def _create_credentials_dict(self) -> dict:
         """Create credentials dict for OAuth flow"""
@@ -125,6 +148,8 @@ class GoogleAuth:
 
         # Refresh if expired but we have a refresh token
         if self.credentials and self.credentials.expired and self.credentials.refresh_token:
+            from google.auth.transport.requests import Request
+
             try:
                 self.credentials.refresh(Request())
                 self._save_token(self.credentials)
@@ -138,7 +163,9 @@ class GoogleAuth:
         # Create client config dict
         client_config = self._create_credentials_dict()
 
-        # Create flow
+        # Create flow (imported here: only needed for first-time authentication)
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         flow = InstalledAppFlow.from_client_config(
             client_config,
             scopes=scopes,
@@ -157,34 +184,147 @@ class GoogleAuth:
         print(f"\n✓ Authentication successful for: {self.credentials.client_id}")
         return self.credentials
 
-    def get_credentials(self, force_refresh: bool = False) -> Credentials:
+    def _needs_refresh(self) -> bool:
+        """Check whether the credentials expire within the refresh margin"""
+        if not self.credentials.refresh_token:
+            return False
+        if self.credentials.expiry is None:
+            return self.credentials.expired
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return self.credentials.expiry - now < timedelta(seconds=self._refresh_margin)
+
+    def _refresh_and_save(self, credentials: Credentials) -> None:
+        """Refresh an access token and save it (blocking network and file I/O)"""
+        from google.auth.transport.requests import Request
+
+        credentials.refresh(Request())
+        self._save_token(credentials)
+
+    async def _refresh(self, credentials: Optional[Credentials] = None) -> None:
+        """Refresh and save the access token off the event loop (caller holds _refresh_lock)"""
+        credentials = credentials or self.credentials
+        await asyncio.get_running_loop().run_in_executor(None, self._refresh_and_save, credentials)
+
+    async def load_saved_credentials(self) -> Optional[Credentials]:
+        """
+        Load the saved token, refreshing it if it has expired, without ever
+        starting the browser flow (for background work such as preloading)
+
+        Returns:
+            Valid credentials, or None when there is no saved token or it has
+            no refresh token; the credentials are only kept once valid
+
+        Raises:
+            Exception: The saved token's refresh failed
+        """
+        async with self._refresh_lock:
+            if self.credentials is not None:
+                return self.credentials
+            credentials = await asyncio.to_thread(self._load_token)
+            if credentials is None:
+                return None
+            if not credentials.valid:
+                if not credentials.refresh_token:
+                    return None
+                await self._refresh(credentials)
+            self.credentials = credentials
+            return credentials
+
+    async def get_credentials(self, force_refresh: bool = False) -> Credentials:
         """
         Get authenticated credentials, refreshing if needed
 
+        Tokens are refreshed shortly before they expire, and concurrent callers
+        share a single refresh instead of each hitting the token endpoint.
+
         Args:
             force_refresh: Force credential refresh even if valid
 
         Returns:
             Valid credentials
+
+        Raises:
+            RuntimeError: The saved token could not be refreshed and the user
+                has to authenticate again
         """
+        # authenticate() does blocking token-file and network I/O (and may run
+        # the browser flow on first use), so it runs in a thread, under the
+        # lock so concurrent first callers share one
         if not self.credentials:
-            self.credentials = self.authenticate()
+            async with self._refresh_lock:
+                if not self.credentials:
+                    await asyncio.to_thread(self.authenticate)
+
+        if force_refresh or self._needs_refresh():
+            async with self._refresh_lock:
+                # Another caller may have refreshed while we waited for the lock
+                if force_refresh or self._needs_refresh():
+                    # A failed refresh (revoked or expired grant, network error)
+                    # is reported rather than answered with the browser flow,
+                    # which would print to stdout and block this tool call
+                    try:
+                        await self._refresh()
+                    except Exception as e:
+                        logger.warning("Credential refresh failed: %s", e)
+                        raise RuntimeError(
+                            f"Google OAuth token refresh failed ({e}). Re-authenticate: "
+                            f"delete {self.token_file} and restart the server, then "
+                            "complete the browser sign-in on the next tool call."
+                        ) from e
+
+        return self.credentials
+
+    def start_proactive_refresh(self) -> asyncio.Task:
+        """Start a background task that refreshes credentials before they expire"""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._proactive_refresher())
+            self._refresher_task.add_done_callback(_log_refresher_exit)
+        return self._refresher_task
+
+    async def _proactive_refresher(self) -> None:
+        """
+        Sleep until shortly before expiry, then refresh, forever
+
+        Failed refreshes are logged and retried with backoff. This never falls
+        back to authenticate(): the interactive flow prints to stdout (the MCP
+        stream in stdio mode) and blocks on a browser; a token that cannot be
+        refreshed surfaces as a re-authentication error on the next tool call.
+        """
+        failures = 0
+        while True:
+            credentials = self.credentials
+            if credentials is None or credentials.expiry is None or not credentials.refresh_token:
+                return
+            if failures:
+                delay = min(REFRESH_RETRY_DELAY * 2 ** (failures - 1), REFRESH_RETRY_MAX_DELAY)
+            else:
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                delay = (credentials.expiry - now).total_seconds() - self._refresh_margin
+            await asyncio.sleep(max(delay, 1))
 
-        if force_refresh or (self.credentials.expired and self.credentials.refresh_token):
             try:
-                self.credentials.refresh(Request())
-                self._save_token(self.credentials)
-            except Exception as e:
-                print(f"Credential refresh failed: {e}")
-                self.credentials = self.authenticate()
+                async with self._refresh_lock:
+                    # A foreground caller may have refreshed while we slept
+                    if self._needs_refresh():
+                        await self._refresh()
+            except Exception:
+                failures += 1
+                logger.warning("Background credential refresh failed (attempt %d)", failures, exc_info=True)
+            else:
+                failures = 0
 
-        return self.credentials
+
+def _log_refresher_exit(task: asyncio.Task) -> None:
+    """Log an unexpected error that ended the proactive refresher"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Proactive credential refresher stopped", exc_info=task.exception())
 
 
 def get_auth() -> GoogleAuth:
     """Get or create global auth instance"""
     global _auth_instance
-    if "_auth_instance" not in globals():
+    if _auth_instance is None:
         _auth_instance = GoogleAuth()
     return _auth_instance
 
@@ -4,23 +4,170 @@ Google Apps Script Web App Client
 Handles communication with the Google Apps Script Web App backend.
 """
 
+import asyncio
+import itertools
 import os
-from typing import Any, Dict, List, Optional
+import weakref
+from collections.abc import AsyncIterator, Iterator, Mapping
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 import httpx
+import orjson
+from cachetools import TTLCache
+
+
+DEFAULT_TIMEOUT = 30.0
+
+# Shared request headers and envelopes for the hottest read calls
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_LIST_EMAILS_ENV = {"service": "gmail", "action": "list"}
+_READ_SHEET_ENV = {"service": "sheets", "action": "read"}
+
+# Read-only (service, action) pairs whose results may be served from cache
+_READ_ONLY_ACTIONS = frozenset({
+    ("gmail", "list"),
+    ("gmail", "search"),
+    ("gmail", "read"),
+    ("sheets", "read"),
+    ("docs", "read"),
+    ("drive", "list"),
+    ("maps", "geocode"),
+    ("maps", "distance"),
+    ("maps", "route"),
+})
+READ_CACHE_SIZE = 1024
+READ_CACHE_TTL = 30
+
+# Read-only calls are retried with exponential backoff on these transport errors,
+# which usually mean a pooled keep-alive connection was closed by the server
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.1
+_RETRYABLE_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.ConnectError)
+
+
+def _raise_for_error(result: Mapping[str, Any]) -> None:
+    """Raise the error a Web App response reports, if any"""
+    if result.get("success") is False or "error" in result:
+        raise RuntimeError(f"Apps Script error: {result.get('error') or 'request failed'}")
+
+
+def _new_http_client(timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Create a pooled HTTP client for talking to Apps Script deployments"""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+class LazyResponse(Mapping):
+    """
+    Read-only mapping over a raw JSON response body
+
+    The body is only parsed the first time it is indexed, so callers that
+    ignore the result never pay for deserializing it.
+    """
+
+    __slots__ = ("_content", "_data")
+
+    def __init__(self, content: bytes):
+        self._content = content
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _parsed(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = orjson.loads(self._content)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._parsed()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parsed())
+
+    def __len__(self) -> int:
+        return len(self._parsed())
+
+    def __repr__(self) -> str:
+        return f"LazyResponse({self._parsed()!r})"
+
+
+class _BatchQueue:
+    """
+    Coalesces calls issued within a short window into one batch request
+
+    A call made while nothing else is in flight is sent straight away; a
+    window only opens once a second call arrives during a send, and a call
+    that ends up alone in its window is sent as a plain request.
+    """
+
+    def __init__(self, client: "GoogleAppsScriptClient", window: float = 0.01):
+        self._client = client
+        self._window = window
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._in_flight = 0
+        # Strong references to send tasks (the loop only keeps weak ones)
+        self._tasks: set = set()
+
+    async def submit(self, payload: Dict[str, Any]) -> Mapping[str, Any]:
+        """Queue a call and wait for its slice of the batch result"""
+        if not self._in_flight and not self._pending:
+            self._in_flight += 1
+            try:
+                return await self._client._post(payload, lazy=True)
+            finally:
+                self._in_flight -= 1
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) == 1:
+            loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._in_flight += 1
+        task = asyncio.ensure_future(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, pending: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            if len(pending) == 1:
+                results = [await self._client._post(pending[0][0], lazy=True)]
+            else:
+                results = await self._client._post_batch([payload for payload, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._in_flight -= 1
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
 
 
 class GoogleAppsScriptClient:
     """Client for interacting with Google Apps Script Web App"""
 
-    def __init__(self, script_url: Optional[str] = None):
+    def __init__(
+        self,
+        script_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the client
 
         Args:
             script_url: URL of the Google Apps Script Web App.
                        If not provided, reads from GOOGLE_APPS_SCRIPT_URL env var.
+            http_client: Shared HTTP client to send requests with. If not
+                       provided, the client creates and owns its own.
         """
         self.script_url = script_url or os.getenv("GOOGLE_APPS_SCRIPT_URL")
         if not self.script_url:
@@ -29,20 +176,45 @@ class GoogleAppsScriptClient:
                 "Set GOOGLE_APPS_SCRIPT_URL environment variable or pass script_url parameter."
             )
 
-        self.timeout = 30.0
+        self.timeout = DEFAULT_TIMEOUT
+
+        # Long-lived HTTP client so successive calls reuse pooled TLS connections
+        self._owns_client = http_client is None
+        self._client = http_client or _new_http_client(self.timeout)
+        self._batch_queue = _BatchQueue(self)
+
+        # Short-lived cache of read-only results as JSON bytes, keyed by
+        # (service, payload); each hit decodes its own copy, so a caller
+        # mutating its result can't change what later callers get
+        self._read_cache: TTLCache = TTLCache(maxsize=READ_CACHE_SIZE, ttl=READ_CACHE_TTL)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool (unless it is shared)"""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "GoogleAppsScriptClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def _call(
         self,
         service: str,
         action: str,
+        lazy: bool = False,
+        no_cache: bool = False,
         **params: Any
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], LazyResponse]:
         """
         Make a call to the Google Apps Script Web App
 
         Args:
             service: The service to call (gmail, sheets, docs, etc.)
             action: The action to perform
+            lazy: Defer parsing the response body until it is first indexed
+            no_cache: Bypass the read cache for read-only actions
             **params: Additional parameters for the action
 
         Returns:
@@ -53,32 +225,177 @@ class GoogleAppsScriptClient:
             "action": action,
             **params
         }
+        return await self._post(payload, lazy=lazy, no_cache=no_cache)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    self.script_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                return {
-                    "success": False,
-                    "error": f"HTTP error: {e.response.status_code}",
-                    "details": str(e)
-                }
-            except httpx.RequestError as e:
-                return {
-                    "success": False,
-                    "error": f"Request error: {str(e)}"
-                }
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": f"Unexpected error: {str(e)}"
-                }
+    def _invalidate(self, service: str) -> None:
+        """Drop cached reads of a service after a write to it"""
+        for key in [key for key in self._read_cache if key[0] == service]:
+            self._read_cache.pop(key, None)
+
+    async def _post(
+        self,
+        payload: Dict[str, Any],
+        lazy: bool = False,
+        no_cache: bool = False
+    ) -> Union[Dict[str, Any], LazyResponse]:
+        """POST a JSON payload to the Web App, serving read-only calls from cache"""
+        service = payload.get("service")
+        if (service, payload.get("action")) not in _READ_ONLY_ACTIONS:
+            if service:
+                self._invalidate(service)
+            return await self._send(payload, lazy=lazy)
+
+        key = (service, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+        if not no_cache:
+            cached = self._read_cache.get(key)
+            if cached is not None:
+                return LazyResponse(cached) if lazy else orjson.loads(cached)
+
+        result = await self._send(payload, lazy=lazy, retry=True)
+        if result.get("success") is not False and "error" not in result:
+            self._read_cache[key] = (
+                result._content if isinstance(result, LazyResponse) else orjson.dumps(result)
+            )
+        return result
+
+    async def _send(
+        self,
+        payload: Dict[str, Any],
+        lazy: bool = False,
+        retry: bool = False
+    ) -> Union[Dict[str, Any], LazyResponse]:
+        """
+        POST a JSON payload to the Web App and map failures to error dicts
+
+        Only idempotent calls should pass retry=True, so writes such as
+        sending an email are never duplicated.
+        """
+        content = orjson.dumps(payload)
+        attempts = RETRY_ATTEMPTS if retry else 1
+        try:
+            for attempt in range(attempts):
+                try:
+                    response = await self._client.post(
+                        self.script_url,
+                        content=content,
+                        headers=_JSON_HEADERS
+                    )
+                    break
+                except _RETRYABLE_ERRORS:
+                    # httpx drops the broken connection, so the retry opens a new one
+                    if attempt + 1 == attempts:
+                        raise
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            response.raise_for_status()
+            if lazy:
+                return LazyResponse(response.content)
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            return {
+                "success": False,
+                "error": f"HTTP error: {e.response.status_code}",
+                "status": e.response.status_code,
+                "details": str(e)
+            }
+        except httpx.RequestError as e:
+            return {
+                "success": False,
+                "error": f"Request error: {str(e)}"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {str(e)}"
+            }
+
+    async def _stream_array(self, payload: Dict[str, Any], key: str) -> AsyncIterator[Any]:
+        """
+        Yield the items of the top-level array `key` as the response streams in
+
+        Uses ijson's push parser when installed, so large responses are parsed
+        while they are still being received; otherwise parses the full body.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            RuntimeError: If the Web App answers with an error body (which has
+                no array, and would otherwise read as an empty one)
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        async with self._client.stream(
+            "POST",
+            self.script_url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+
+            if ijson is None:
+                data = orjson.loads(await response.aread())
+                _raise_for_error(data)
+                for item in data.get(key) or []:
+                    yield item
+                return
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, f"{key}.item")
+            # A second parser picks out the top-level success/error fields
+            events = ijson.sendable_list()
+            status_parser = ijson.parse_coro(events)
+            status: Dict[str, Any] = {}
+
+            def check_status() -> None:
+                for prefix, _, value in events:
+                    if prefix in ("success", "error"):
+                        status[prefix] = value
+                del events[:]
+                _raise_for_error(status)
+
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                status_parser.send(chunk)
+                check_status()
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            status_parser.close()
+            check_status()
+            for item in items:
+                yield item
+
+    async def _post_batch(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several call payloads as a single batch request"""
+        for payload in payloads:
+            if (payload.get("service"), payload.get("action")) not in _READ_ONLY_ACTIONS:
+                self._invalidate(payload.get("service"))
+        result = await self._send({"batch": payloads})
+        results = result.get("results")
+        if not isinstance(results, list) or len(results) != len(payloads):
+            # Transport or script-level failure: every call gets the error
+            return [result] * len(payloads)
+        return results
+
+    async def batch(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several calls in one round trip
+
+        Args:
+            calls: List of (service, action, params) tuples
+
+        Returns:
+            List of per-call results, in the same order as calls
+        """
+        return await self._post_batch([
+            {"service": service, "action": action, **params}
+            for service, action, params in calls
+        ])
 
     # =============================================
     # GMAIL
@@ -86,7 +403,7 @@ class GoogleAppsScriptClient:
 
     async def list_emails(self, max_results: int = 10) -> Dict[str, Any]:
         """List recent emails"""
-        return await self._call("gmail", "list", max=max_results)
+        return await self._post({**_LIST_EMAILS_ENV, "max": max_results})
 
     async def send_email(
         self,
@@ -127,7 +444,18 @@ class GoogleAppsScriptClient:
         range_str: str = "A1"
     ) -> Dict[str, Any]:
         """Read data from a spreadsheet"""
-        return await self._call("sheets", "read", sheetId=sheet_id, range=range_str)
+        return await self._post({**_READ_SHEET_ENV, "sheetId": sheet_id, "range": range_str})
+
+    async def read_sheet_iter(
+        self,
+        sheet_id: str,
+        range_str: str = "A1"
+    ) -> AsyncIterator[List[Any]]:
+        """Read a spreadsheet range row by row as the response arrives"""
+        async for row in self._stream_array(
+            {**_READ_SHEET_ENV, "sheetId": sheet_id, "range": range_str}, "data"
+        ):
+            yield row
 
     async def write_sheet(
         self,
@@ -148,9 +476,14 @@ class GoogleAppsScriptClient:
         self,
         sheet_id: str,
         row_data: List[Any]
-    ) -> Dict[str, Any]:
-        """Append a row to a spreadsheet"""
-        return await self._call("sheets", "append", sheetId=sheet_id, data=row_data)
+    ) -> Mapping[str, Any]:
+        """Append a row to a spreadsheet (bursts of appends share one request)"""
+        return await self._batch_queue.submit({
+            "service": "sheets",
+            "action": "append",
+            "sheetId": sheet_id,
+            "data": row_data,
+        })
 
     # =============================================
     # DOCS
@@ -195,13 +528,13 @@ class GoogleAppsScriptClient:
             content=content
         )
 
-    async def create_folder(self, name: str) -> Dict[str, Any]:
+    async def create_folder(self, name: str) -> Mapping[str, Any]:
         """Create a folder in Drive"""
-        return await self._call("drive", "create", name=name, type="folder")
+        return await self._call("drive", "create", lazy=True, name=name, type="folder")
 
-    async def share_file(self, file_id: str, email: str) -> Dict[str, Any]:
+    async def share_file(self, file_id: str, email: str) -> Mapping[str, Any]:
         """Share a file"""
-        return await self._call("drive", "share", id=file_id, email=email)
+        return await self._call("drive", "share", lazy=True, id=file_id, email=email)
 
     # =============================================
     # SLIDES
@@ -282,3 +615,80 @@ class GoogleAppsScriptClient:
     ) -> Dict[str, Any]:
         """Create a note in Google Keep"""
         return await self._call("keep", "create", title=title, content=content)
+
+
+class ClientPool:
+    """
+    Round-robin pool of Apps Script clients, one per Web App deployment
+
+    Apps Script quotas apply per deployment/account, so spreading calls over
+    several deployments raises aggregate throughput. A call rejected with
+    HTTP 429 is retried on the next deployment in the pool.
+    """
+
+    def __init__(self, script_urls: Optional[List[str]] = None):
+        """
+        Initialize the pool
+
+        Args:
+            script_urls: Web App URLs to spread calls over. If not provided,
+                        reads the comma-separated GOOGLE_APPS_SCRIPT_URLS env var,
+                        falling back to the single GOOGLE_APPS_SCRIPT_URL.
+        """
+        if script_urls is None:
+            urls = os.getenv("GOOGLE_APPS_SCRIPT_URLS", "")
+            script_urls = [url.strip() for url in urls.split(",") if url.strip()]
+
+        # All members share one connection pool and its limits
+        self._http = _new_http_client()
+        self.clients = [
+            GoogleAppsScriptClient(url, http_client=self._http)
+            for url in (script_urls or [None])
+        ]
+        self._cycle = itertools.cycle(self.clients)
+
+    async def call(
+        self,
+        service: str,
+        action: str,
+        **params: Any
+    ) -> Union[Dict[str, Any], LazyResponse]:
+        """Make a call on the next client, moving on to another one on 429"""
+        result: Union[Dict[str, Any], LazyResponse] = {}
+        for _ in range(len(self.clients)):
+            result = await next(self._cycle)._call(service, action, **params)
+            if result.get("status") != 429:
+                break
+        return result
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool"""
+        await self._http.aclose()
+
+
+def get_client() -> GoogleAppsScriptClient:
+    """
+    Get or create the client for the running event loop
+
+    httpx connection pools are bound to the loop they were used on, so each
+    loop gets its own client. Entries go away together with their loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = GoogleAppsScriptClient()
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close and forget the client of the running event loop, if any"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Per-event-loop client instances (initialized on first use)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GoogleAppsScriptClient]" = (
+    weakref.WeakKeyDictionary()
+)
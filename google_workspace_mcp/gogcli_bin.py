@@ -0,0 +1,30 @@
+"""
+gogcli Executable Lookup
+
+Shared by both gogcli-backed servers, so they always launch the same binary.
+"""
+
+import os
+import shutil
+
+GOGCLI_BIN = os.getenv("GOGCLI_BIN", "gogcli")
+
+# GOGCLI_BIN resolved against PATH, filled on first successful lookup
+_gogcli_path: str | None = None
+
+
+def gogcli_executable() -> str:
+    """
+    Return GOGCLI_BIN as a path
+
+    subprocess only launches children with posix_spawn (instead of forking
+    this whole process) when the executable is given with a directory. Until
+    gogcli is found on PATH, GOGCLI_BIN is returned as is (and looked up
+    again on the next call), so launching it reports the missing binary.
+    """
+    global _gogcli_path
+    if _gogcli_path is None:
+        _gogcli_path = shutil.which(GOGCLI_BIN)
+        if _gogcli_path is None:
+            return GOGCLI_BIN
+    return _gogcli_path
@@ -9,11 +9,17 @@ Services: Gmail, Sheets, Docs, Slides, Calendar, Drive
 """
 
 import asyncio
-import json
+import contextvars
+import csv
+import io
+import logging
 import os
-import subprocess
+import re
+import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, NamedTuple
 
 # Load .env file if it exists
 try:
@@ -25,33 +31,85 @@ try:
 except ImportError:
     pass
 
-import httpx
+# Validate tool arguments against their inputSchema when jsonschema is available
+try:
+    from jsonschema import Draft7Validator
+except ImportError:
+    Draft7Validator = None
+
+import orjson
+from cachetools import TTLCache
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
-from mcp.server.sse import SseServerTransport
 from mcp.types import (
     Tool,
     TextContent,
 )
 
+from google_workspace_mcp.gogcli_bin import GOGCLI_BIN, gogcli_executable
+
+logger = logging.getLogger(__name__)
+
 # Configuration
 DEFAULT_PORT = 9001
-GOGCLI_BIN = os.getenv("GOGCLI_BIN", "gogcli")
 DEFAULT_ACCOUNT = os.getenv("GOGCLI_ACCOUNT", None)  # Use None instead of empty string
-
-
-def run_gogcli(
+# Pipe HTML email bodies to gogcli through an inherited pipe (/dev/fd/N); set to
+# 0 where /dev/fd paths can't be opened (e.g. Windows) to fall back to a
+# temporary file
+GOGCLI_SUPPORTS_STDIN_BODY = os.getenv("GOGCLI_SUPPORTS_STDIN_BODY", "1").lower() not in ("0", "false", "no")
+
+# Send a progress notification every this many lines of listing output
+PROGRESS_EVERY = 20
+
+# gmail_batch_* cap (Gmail's own), and gogcli processes a batch tool runs at once
+BATCH_MAX_MESSAGES = 100
+BATCH_CONCURRENCY = 8
+
+LineCallback = Callable[[int], Awaitable[None]]
+
+# Upper bound on gogcli processes running at once, so a burst of parallel tool
+# calls queues up instead of fork-storming the machine
+GOGCLI_MAX_CONCURRENCY = int(os.getenv("GOGCLI_MAX_CONCURRENCY", "16"))
+_GOGCLI_SEM = asyncio.Semaphore(GOGCLI_MAX_CONCURRENCY)
+
+async def _communicate_lines(
+    proc: asyncio.subprocess.Process, on_line: LineCallback
+) -> tuple[bytes, bytes]:
+    """Like proc.communicate(), but call on_line(count) as stdout lines arrive"""
+
+    async def read_stdout() -> bytes:
+        # Read chunks rather than readline(): a single JSON line can exceed
+        # the stream reader's 64 KiB line limit
+        chunks = []
+        lines = 0
+        while chunk := await proc.stdout.read(65536):
+            chunks.append(chunk)
+            for _ in range(chunk.count(b"\n")):
+                lines += 1
+                await on_line(lines)
+        return b"".join(chunks)
+
+    stdout, stderr = await asyncio.gather(read_stdout(), proc.stderr.read())
+    await proc.wait()
+    return stdout, stderr
+
+
+async def run_gogcli(
     service: str,
     command: str,
     args: list[str],
     account: str | None = None,
     html_body: str | None = None,
-    timeout: int = 60
+    timeout: int = 60,
+    on_line: LineCallback | None = None
 ) -> dict[str, Any]:
     """
     Run a gogcli command directly and return the result
 
+    The command runs as an asyncio subprocess, so other tool calls keep being
+    served while gogcli is working.
+
     Args:
         service: The gogcli service (gmail, sheets, docs, slides, calendar, drive)
         command: The command to run
@@ -59,97 +117,311 @@ def run_gogcli(
         account: Google account to use
         html_body: HTML content for email (optional)
         timeout: Command timeout in seconds
+        on_line: Coroutine called with the running line count while stdout
+            is read (ignored when html_body is given)
 
     Returns:
         Dict with success status and result/error
     """
-    gog_cmd = [GOGCLI_BIN, service, command]
+    gog_cmd = [gogcli_executable(), service, command]
     gog_cmd.extend(args)
 
-    # Handle HTML body for emails
-    if html_body:
-        # Create temp file with HTML content
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_body)
-            html_file = f.name
-
-        gog_cmd.extend(["--body-html", f"@{html_file}"])
+    html_file = None
+    # HTML body pipe: the child's read end, and our write end
+    body_read_fd = body_write_fd = None
 
+    await _GOGCLI_SEM.acquire()
     try:
-        result = subprocess.run(
-            gog_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+        # Handle HTML body for emails: gogcli reads "@path" bodies from a file, so
+        # hand it the read end of a pipe as /dev/fd/N and write the HTML in (no
+        # temp file, no quoting). Not /dev/stdin: event loops such as uvloop
+        # create subprocess stdio as socketpairs, which /dev/stdin can't open.
+        if html_body:
+            if GOGCLI_SUPPORTS_STDIN_BODY:
+                body_read_fd, body_write_fd = os.pipe()
+                gog_cmd.extend(["--body-html", f"@/dev/fd/{body_read_fd}"])
+            else:
+                # Created inside the try so the finally below always removes it
+                fd, html_file = tempfile.mkstemp(suffix=".html")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(html_body.encode())
+                gog_cmd.extend(["--body-html", f"@{html_file}"])
+
+        logger.debug("gogcli cmd: %s", gog_cmd)
+        pass_fds = (body_read_fd,) if body_read_fd is not None else ()
+        proc = await asyncio.create_subprocess_exec(
+            *gog_cmd,
+            # Never inherit our stdin: in stdio mode it carries the MCP stream
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # With close_fds=False (and no preexec_fn/cwd) CPython can use
+            # posix_spawn; our own fds are non-inheritable anyway (PEP 446).
+            # pass_fds requires close_fds.
+            pass_fds=pass_fds,
+            close_fds=bool(pass_fds),
         )
+        if body_write_fd is not None:
+            os.close(body_read_fd)
+            body_read_fd = None
+            # The transport owns the write end from here; close() flushes the
+            # body, then signals EOF
+            pipe = open(body_write_fd, "wb", buffering=0)
+            body_write_fd = None
+            transport, _ = await asyncio.get_running_loop().connect_write_pipe(asyncio.Protocol, pipe)
+            transport.write(html_body.encode())
+            transport.close()
+
+        if on_line is not None and not html_body:
+            communicate = _communicate_lines(proc, on_line)
+        else:
+            communicate = proc.communicate()
+        try:
+            stdout, stderr = await asyncio.wait_for(communicate, timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {
+                "success": False,
+                "error": f"Command timed out after {timeout} seconds"
+            }
 
-        # Cleanup temp file if created
-        if html_body:
-            try:
-                os.unlink(html_file)
-            except:
-                pass
+        # Decode each buffer once (skipping empty ones, e.g. stderr on success);
+        # a stray invalid byte shouldn't turn into an error
+        output = stdout.decode("utf-8", errors="replace").strip() if stdout else ""
+        errors = stderr.decode("utf-8", errors="replace").strip() if stderr else ""
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             return {
                 "success": True,
-                "output": result.stdout.strip(),
-                "stderr": result.stderr.strip()
+                "output": output,
+                "stderr": errors
             }
         else:
             return {
                 "success": False,
-                "error": result.stderr.strip() or result.stdout.strip(),
-                "returncode": result.returncode
+                "error": errors or output,
+                "returncode": proc.returncode
             }
-        #imprimir el comando ejecutado y su resultado para debug
-        print(f"[MCP DEBUG] Command: {' '.join(gog_cmd)}", flush=True)
 
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "error": f"Command timed out after {timeout} seconds"
-        }
     except Exception as e:
         return {
             "success": False,
             "error": str(e)
         }
+    finally:
+        _GOGCLI_SEM.release()
+        for fd in (body_read_fd, body_write_fd):
+            if fd is not None:
+                os.close(fd)
+        if html_file is not None:
+            try:
+                os.unlink(html_file)
+            except OSError as e:
+                logger.warning("Could not remove temporary HTML body %s: %s", html_file, e)
 
 
-# Create server instance
-server = Server("google-workspace-gogcli-server")
+# gogcli --version output; the binary doesn't change under a running server
+_VERSION_CACHE: str | None = None
+
+
+async def get_gogcli_version() -> dict[str, Any]:
+    """
+    Return gogcli's version, running `gogcli --version` only the first time
+
+    Only successful lookups are cached, so a missing or broken gogcli is
+    retried on the next call.
+
+    Returns:
+        Dict in the same shape as run_gogcli's result
+    """
+    global _VERSION_CACHE
+    if _VERSION_CACHE is not None:
+        return {"success": True, "output": _VERSION_CACHE}
+
+    result = await run_gogcli("--version", "", [], account=None, timeout=10)
+    if result["success"]:
+        _VERSION_CACHE = result["output"]
+    return result
 
 
 # =============================================
-# RESOURCES
+# READ CACHE
 # =============================================
 
-@server.list_resources()
-async def handle_list_resources() -> list:
-    """List available resources"""
-    return [
-        {
-            "uri": "workspace://info",
-            "name": "Workspace Information",
-            "description": "Information about the Google Workspace MCP server (gogcli backend)",
-            "mimeType": "text/plain",
-        },
-        {
-            "uri": "workspace://gogcli-version",
-            "name": "gogcli Version",
-            "description": "gogcli version information",
-            "mimeType": "text/plain",
-        },
-    ]
+READ_CACHE_SIZE = 512
+READ_CACHE_TTL = 30
+
+# Idempotent read tools -> argument naming the resource they read (None: a
+# listing or search over the whole service)
+_CACHED_READS: dict[str, str | None] = {
+    "gmail_list_emails": None,
+    "gmail_search_emails": None,
+    "gmail_read_email": "message_id",
+    "sheets_read": "spreadsheet_id",
+    "docs_read": "doc_id",
+    "slides_read": "presentation_id",
+    "calendar_list_events": None,
+    "drive_list_files": None,
+    "drive_get_file": "file_id",
+    "drive_permissions": "file_id",
+    "drive_url": "file_id",
+    "drive_list_comments": "file_id",
+}
+
+# Write tools -> argument naming the resource they change. Every write also
+# drops its service's cached listings, whose contents it may have changed.
+_INVALIDATING_WRITES: dict[str, str | None] = {
+    "gmail_send_email": None,
+    "gmail_label_email": "message_id",
+    "gmail_archive_email": "message_id",
+    "gmail_delete_email": "message_id",
+    "sheets_create": None,
+    "sheets_write": "spreadsheet_id",
+    "sheets_append": "spreadsheet_id",
+    "sheets_delete": "spreadsheet_id",
+    "docs_create": None,
+    "docs_append": "doc_id",
+    "docs_delete": "doc_id",
+    "slides_create": None,
+    "slides_delete": "presentation_id",
+    "calendar_create_event": None,
+    "calendar_update_event": None,
+    "calendar_delete_event": None,
+    "drive_upload": None,
+    "drive_mkdir": None,
+    "drive_copy": None,
+    "drive_delete": "file_id",
+    "drive_move": "file_id",
+    "drive_rename": "file_id",
+    "drive_share": "file_id",
+    "drive_unshare": "file_id",
+    "drive_add_comment": "file_id",
+}
+
+# Writes that add or remove a Drive file, which also changes the Drive listings
+_DRIVE_FILE_WRITES = frozenset({
+    "sheets_create", "sheets_delete",
+    "docs_create", "docs_delete",
+    "slides_create", "slides_delete",
+})
+
+
+class _IndexedTTLCache(TTLCache):
+    """
+    TTLCache that indexes its keys by the resource they read
 
+    The index is pruned whenever an entry leaves the cache (expiry, eviction
+    or pop), so it always lists exactly the live keys for each resource.
+    """
 
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
-    """Read a resource"""
-    if uri == "workspace://info":
-        return """Google Workspace MCP Server v0.4.0 (gogcli Edition)
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        super().__init__(maxsize, ttl, timer)
+        self._resources: dict[Any, str] = {}
+        self._index: dict[str, set] = {}
+
+    def add(self, key: Any, value: Any, resource: str) -> None:
+        """Cache value under key, indexed under the resource it read"""
+        self[key] = value
+        self._resources[key] = resource
+        self._index.setdefault(resource, set()).add(key)
+
+    def drop(self, resource: str) -> None:
+        """Drop every cached read of resource"""
+        for key in list(self._index.get(resource, ())):
+            self.pop(key, None)
+            # pop skips entries that expired but were not yet purged
+            self._unindex(key)
+
+    def _unindex(self, key: Any) -> None:
+        resource = self._resources.pop(key, None)
+        keys = self._index.get(resource)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._index[resource]
+
+    def __delitem__(self, key: Any) -> None:
+        # Also reached through pop() and popitem() (size eviction)
+        super().__delitem__(key)
+        self._unindex(key)
+
+    def expire(self, time: float | None = None):
+        # cachetools >= 5.5 returns the expired (key, value) pairs
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._unindex(key)
+        return expired
+
+
+_read_cache = _IndexedTTLCache(maxsize=READ_CACHE_SIZE, ttl=READ_CACHE_TTL)
+
+
+def _service(tool: str) -> str:
+    """The service a tool belongs to ("gmail_read_email" -> "gmail")"""
+    return tool.split("_", 1)[0]
+
+
+def _resource(tool: str, arg: str | None, arguments: dict[str, Any]) -> str:
+    """Name the resource a tool call touches, for cache invalidation"""
+    if arg is None:
+        return _service(tool)
+    return str(arguments.get(arg, ""))
+
+
+async def _cached_run(
+    tool: str,
+    arguments: dict[str, Any],
+    service: str,
+    command: str,
+    args: list[str],
+    account: str | None = None,
+    on_line: LineCallback | None = None,
+) -> dict[str, Any]:
+    """
+    run_gogcli for an idempotent read, served from the read cache when possible
+
+    Args:
+        tool: The MCP tool name (must be in _CACHED_READS)
+        arguments: The tool call arguments, used for the cache key; a true
+            no_cache skips the lookup
+        service: The gogcli service
+        command: The command to run
+        args: Additional arguments
+        account: Google account to use
+        on_line: Progress callback passed on to run_gogcli on a cache miss
+
+    Returns:
+        Dict with success status and result/error; only successes are cached
+    """
+    # no_cache skips the lookup but still refreshes the entry for later calls
+    no_cache = arguments.get("no_cache", False)
+    if "no_cache" in arguments:
+        arguments = {k: v for k, v in arguments.items() if k != "no_cache"}
+
+    key = (tool, account, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    if not no_cache:
+        cached = _read_cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = await run_gogcli(service, command, args, account, on_line=on_line)
+    if result["success"]:
+        _read_cache.add(key, result, _resource(tool, _CACHED_READS[tool], arguments))
+    return result
+
+
+def _invalidate(tool: str, arguments: dict[str, Any]) -> None:
+    """Drop cached reads of the resource a write tool just changed, and its service's listings"""
+    resources = {_resource(tool, _INVALIDATING_WRITES[tool], arguments), _service(tool)}
+    if tool in _DRIVE_FILE_WRITES:
+        resources.add("drive")
+    for resource in resources:
+        _read_cache.drop(resource)
+
+
+# workspace://info contents
+WORKSPACE_INFO = """Google Workspace MCP Server v0.4.0 (gogcli Edition)
 
 This server provides tools for interacting with Google Workspace services:
 - Gmail: Send, read, search emails with HTML support
@@ -164,8 +436,51 @@ Authentication: Direct OAuth execution (no keyring needed)
 
 Run ./install.sh --server-only to start the server on port 9001.
 """
+
+
+# Create server instance
+server = Server("google-workspace-gogcli-server")
+
+
+# =============================================
+# RESOURCES
+# =============================================
+
+_RESOURCES = (
+    {
+        "uri": "workspace://info",
+        "name": "Workspace Information",
+        "description": "Information about the Google Workspace MCP server (gogcli backend)",
+        "mimeType": "text/plain",
+    },
+    {
+        "uri": "workspace://gogcli-version",
+        "name": "gogcli Version",
+        "description": "gogcli version information",
+        "mimeType": "text/plain",
+    },
+)
+
+# Resources whose contents never change
+_RESOURCE_TABLE = {
+    "workspace://info": WORKSPACE_INFO,
+}
+
+
+@server.list_resources()
+async def handle_list_resources() -> list:
+    """List available resources"""
+    return list(_RESOURCES)
+
+
+@server.read_resource()
+async def handle_read_resource(uri: str) -> str:
+    """Read a resource"""
+    text = _RESOURCE_TABLE.get(uri)
+    if text is not None:
+        return text
     elif uri == "workspace://gogcli-version":
-        result = run_gogcli("--version", "", [], timeout=10)
+        result = await get_gogcli_version()
         if result["success"]:
             return result["output"]
         else:
@@ -175,879 +490,1176 @@ Run ./install.sh --server-only to start the server on port 9001.
 
 
 # =============================================
-# GMAIL TOOLS
+# TOOLS
 # =============================================
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        # SYSTEM/STATUS TOOLS
-        Tool(
-            name="gogcli_status",
-            description="Check gogcli authentication status and configuration",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="gogcli_version",
-            description="Get gogcli version information",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+# Built once at import; tools/list just hands back this tuple
+_TOOLS: tuple[Tool, ...] = (
+    # SYSTEM/STATUS TOOLS
+    Tool(
+        name="gogcli_status",
+        description="Check gogcli authentication status and configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="gogcli_version",
+        description="Get gogcli version information",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="workspace_batch",
+        description=(
+            "Run several independent tool calls concurrently and return all their "
+            "results in one reply. Use instead of sequential calls when none "
+            "depends on another's output."
         ),
-        # GMAIL TOOLS
-        Tool(
-            name="gmail_send_email",
-            description="Send an email via Gmail (supports HTML - use html:true)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to": {"type": "string", "description": "Recipient email(s), comma-separated"},
-                    "subject": {"type": "string", "description": "Email subject"},
-                    "body": {"type": "string", "description": "Email body (plain text or HTML)"},
-                    "html": {"type": "boolean", "description": "Treat body as HTML (default: false)", "default": False},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Tool name"},
+                            "arguments": {"type": "object", "description": "Tool arguments"},
+                        },
+                        "required": ["name"],
+                    },
                 },
-                "required": ["to", "subject", "body"],
             },
-        ),
-        Tool(
-            name="gmail_list_emails",
-            description="List recent emails from Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer", "description": "Number of emails to list", "default": 10},
-                },
+            "required": ["calls"],
+        },
+    ),
+    # GMAIL TOOLS
+    Tool(
+        name="gmail_send_email",
+        description="Send an email via Gmail (supports HTML - use html:true)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {"type": "string", "description": "Recipient email(s), comma-separated"},
+                "subject": {"type": "string", "description": "Email subject"},
+                "body": {"type": "string", "description": "Email body (plain text or HTML)"},
+                "html": {"type": "boolean", "description": "Treat body as HTML (default: false)", "default": False},
             },
-        ),
-        Tool(
-            name="gmail_search_emails",
-            description="Search for emails in Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"},
-                    "limit": {"type": "integer", "description": "Number of results", "default": 10},
-                },
-                "required": ["query"],
+            "required": ["to", "subject", "body"],
+        },
+    ),
+    Tool(
+        name="gmail_list_emails",
+        description="List recent emails from Gmail; to act on several results, pass their IDs to a gmail_batch_* tool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "description": "Number of emails to list", "default": 10},
             },
-        ),
-        Tool(
-            name="gmail_read_email",
-            description="Read a full email by message ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {"type": "string", "description": "Gmail message ID"},
-                },
-                "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_search_emails",
+        description="Search for emails in Gmail; to act on several results, pass their IDs to a gmail_batch_* tool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "limit": {"type": "integer", "description": "Number of results", "default": 10},
             },
-        ),
-        Tool(
-            name="gmail_label_email",
-            description="Add or remove labels from an email",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {"type": "string", "description": "Gmail message ID"},
-                    "labels": {"type": "string", "description": "Labels to add (comma-separated)"},
-                    "remove": {"type": "string", "description": "Labels to remove (comma-separated)"},
-                },
-                "required": ["message_id"],
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="gmail_read_email",
+        description="Read a full email by message ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {"type": "string", "description": "Gmail message ID"},
             },
-        ),
-        Tool(
-            name="gmail_archive_email",
-            description="Archive an email (remove from inbox)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {"type": "string", "description": "Gmail message ID"},
-                },
-                "required": ["message_id"],
+            "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_label_email",
+        description="Add or remove labels from an email",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {"type": "string", "description": "Gmail message ID"},
+                "labels": {"type": "string", "description": "Labels to add (comma-separated)"},
+                "remove": {"type": "string", "description": "Labels to remove (comma-separated)"},
             },
-        ),
-        Tool(
-            name="gmail_delete_email",
-            description="Delete an email",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {"type": "string", "description": "Gmail message ID"},
+            "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_batch_read",
+        description="Read several emails by message ID in one call (up to 100)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Gmail message IDs",
                 },
-                "required": ["message_id"],
             },
-        ),
-
-        # SHEETS TOOLS
-        Tool(
-            name="sheets_create",
-            description="Create a new Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Spreadsheet title"},
+            "required": ["message_ids"],
+        },
+    ),
+    Tool(
+        name="gmail_batch_label",
+        description="Add or remove labels on several emails in one call (up to 100)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Gmail message IDs",
                 },
-                "required": ["title"],
+                "labels": {"type": "string", "description": "Labels to add (comma-separated)"},
+                "remove": {"type": "string", "description": "Labels to remove (comma-separated)"},
             },
-        ),
-        Tool(
-            name="sheets_read",
-            description="Read data from a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
-                    "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
-                },
-                "required": ["spreadsheet_id"],
+            "required": ["message_ids"],
+        },
+    ),
+    Tool(
+        name="gmail_archive_email",
+        description="Archive an email (remove from inbox)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {"type": "string", "description": "Gmail message ID"},
             },
-        ),
-        Tool(
-            name="sheets_write",
-            description="Write data to a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
-                    "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
-                    "data": {"type": "string", "description": "Data to write (JSON array of arrays or CSV)"},
-                },
-                "required": ["spreadsheet_id", "range", "data"],
+            "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_delete_email",
+        description="Delete an email",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {"type": "string", "description": "Gmail message ID"},
             },
-        ),
-        Tool(
-            name="sheets_append",
-            description="Append rows to a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
-                    "range": {"type": "string", "description": "Range to append to"},
-                    "data": {"type": "string", "description": "Data to append (JSON array or CSV)"},
+            "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_batch_archive",
+        description="Archive several emails in one call (up to 100)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Gmail message IDs",
                 },
-                "required": ["spreadsheet_id", "data"],
             },
-        ),
-        Tool(
-            name="sheets_delete",
-            description="Delete a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
+            "required": ["message_ids"],
+        },
+    ),
+    Tool(
+        name="gmail_batch_delete",
+        description="Delete several emails in one call (up to 100)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Gmail message IDs",
                 },
-                "required": ["spreadsheet_id"],
             },
-        ),
-
-        # DOCS TOOLS
-        Tool(
-            name="docs_create",
-            description="Create a new Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Document title"},
-                    "content": {"type": "string", "description": "Initial content"},
-                },
-                "required": ["title"],
+            "required": ["message_ids"],
+        },
+    ),
+
+    # SHEETS TOOLS
+    Tool(
+        name="sheets_create",
+        description="Create a new Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Spreadsheet title"},
             },
-        ),
-        Tool(
-            name="docs_read",
-            description="Read a Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {"type": "string", "description": "Document ID or URL"},
-                },
-                "required": ["doc_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="sheets_read",
+        description="Read data from a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
+                "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
             },
-        ),
-        Tool(
-            name="docs_append",
-            description="Append text to a Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {"type": "string", "description": "Document ID or URL"},
-                    "text": {"type": "string", "description": "Text to append"},
-                },
-                "required": ["doc_id", "text"],
+            "required": ["spreadsheet_id"],
+        },
+    ),
+    Tool(
+        name="sheets_write",
+        description="Write data to a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
+                "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
+                "data": {"type": "string", "description": "Data to write (JSON array of arrays or CSV)"},
             },
-        ),
-        Tool(
-            name="docs_delete",
-            description="Delete a Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {"type": "string", "description": "Document ID or URL"},
-                },
-                "required": ["doc_id"],
+            "required": ["spreadsheet_id", "range", "data"],
+        },
+    ),
+    Tool(
+        name="sheets_append",
+        description="Append rows to a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
+                "range": {"type": "string", "description": "Range to append to"},
+                "data": {"type": "string", "description": "Data to append (JSON array or CSV)"},
             },
-        ),
-
-        # SLIDES TOOLS
-        Tool(
-            name="slides_create",
-            description="Create a new Google Slides presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Presentation title"},
-                },
-                "required": ["title"],
+            "required": ["spreadsheet_id", "data"],
+        },
+    ),
+    Tool(
+        name="sheets_delete",
+        description="Delete a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID or URL"},
             },
-        ),
-        Tool(
-            name="slides_read",
-            description="Read a Google Slides presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID or URL"},
-                },
-                "required": ["presentation_id"],
+            "required": ["spreadsheet_id"],
+        },
+    ),
+
+    # DOCS TOOLS
+    Tool(
+        name="docs_create",
+        description="Create a new Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Document title"},
+                "content": {"type": "string", "description": "Initial content"},
             },
-        ),
-        Tool(
-            name="slides_delete",
-            description="Delete a Google Slides presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID or URL"},
-                },
-                "required": ["presentation_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="docs_read",
+        description="Read a Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {"type": "string", "description": "Document ID or URL"},
             },
-        ),
-
-        # CALENDAR TOOLS
-        Tool(
-            name="calendar_create_event",
-            description="Create a new calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Event title"},
-                    "start": {"type": "string", "description": "Start time (RFC3339 or 'tomorrow 10am')"},
-                    "end": {"type": "string", "description": "End time (RFC3339 or 'tomorrow 11am')"},
-                    "description": {"type": "string", "description": "Event description"},
-                    "location": {"type": "string", "description": "Event location"},
-                    "attendees": {"type": "string", "description": "Attendees (comma-separated emails)"},
-                },
-                "required": ["title", "start", "end"],
+            "required": ["doc_id"],
+        },
+    ),
+    Tool(
+        name="docs_append",
+        description="Append text to a Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {"type": "string", "description": "Document ID or URL"},
+                "text": {"type": "string", "description": "Text to append"},
             },
-        ),
-        Tool(
-            name="calendar_list_events",
-            description="List calendar events",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start": {"type": "string", "description": "Start date (default: today)"},
-                    "end": {"type": "string", "description": "End date"},
-                    "limit": {"type": "integer", "description": "Max events to return", "default": 10},
-                },
+            "required": ["doc_id", "text"],
+        },
+    ),
+    Tool(
+        name="docs_delete",
+        description="Delete a Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {"type": "string", "description": "Document ID or URL"},
             },
-        ),
-        Tool(
-            name="calendar_delete_event",
-            description="Delete a calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {"type": "string", "description": "Event ID"},
-                },
-                "required": ["event_id"],
+            "required": ["doc_id"],
+        },
+    ),
+
+    # SLIDES TOOLS
+    Tool(
+        name="slides_create",
+        description="Create a new Google Slides presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Presentation title"},
             },
-        ),
-        Tool(
-            name="calendar_update_event",
-            description="Update a calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {"type": "string", "description": "Event ID"},
-                    "title": {"type": "string", "description": "New title"},
-                    "start": {"type": "string", "description": "New start time"},
-                    "end": {"type": "string", "description": "New end time"},
-                    "description": {"type": "string", "description": "New description"},
-                    "location": {"type": "string", "description": "New location"},
-                },
-                "required": ["event_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="slides_read",
+        description="Read a Google Slides presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": {"type": "string", "description": "Presentation ID or URL"},
             },
-        ),
-        # DRIVE TOOLS
-        Tool(
-            name="drive_list_files",
-            description="List files in Google Drive folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "parent": {"type": "string", "description": "Parent folder ID (default: root)"}
-                }
+            "required": ["presentation_id"],
+        },
+    ),
+    Tool(
+        name="slides_delete",
+        description="Delete a Google Slides presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": {"type": "string", "description": "Presentation ID or URL"},
             },
-        ),
-        Tool(
-            name="drive_search",
-            description="Search files in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"},
-                },
-                "required": ["query"],
+            "required": ["presentation_id"],
+        },
+    ),
+
+    # CALENDAR TOOLS
+    Tool(
+        name="calendar_create_event",
+        description="Create a new calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Event title"},
+                "start": {"type": "string", "description": "Start time (RFC3339 or 'tomorrow 10am')"},
+                "end": {"type": "string", "description": "End time (RFC3339 or 'tomorrow 11am')"},
+                "description": {"type": "string", "description": "Event description"},
+                "location": {"type": "string", "description": "Event location"},
+                "attendees": {"type": "string", "description": "Attendees (comma-separated emails)"},
             },
-        ),
-        Tool(
-            name="drive_get_file",
-            description="Get file metadata from Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID"},
-                },
-                "required": ["file_id"],
+            "required": ["title", "start", "end"],
+        },
+    ),
+    Tool(
+        name="calendar_list_events",
+        description="List calendar events",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start": {"type": "string", "description": "Start date (default: today)"},
+                "end": {"type": "string", "description": "End date"},
+                "limit": {"type": "integer", "description": "Max events to return", "default": 10},
             },
-        ),
-        Tool(
-            name="drive_download",
-            description="Download a file from Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to download"},
-                    "output": {"type": "string", "description": "Output path (optional)"},
-                },
-                "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="calendar_delete_event",
+        description="Delete a calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {"type": "string", "description": "Event ID"},
             },
-        ),
-        Tool(
-            name="drive_upload",
-            description="Upload a file to Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Local file path to upload"},
-                    "parent": {"type": "string", "description": "Parent folder ID (default: root)"},
-                },
-                "required": ["file_path"],
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="calendar_update_event",
+        description="Update a calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {"type": "string", "description": "Event ID"},
+                "title": {"type": "string", "description": "New title"},
+                "start": {"type": "string", "description": "New start time"},
+                "end": {"type": "string", "description": "New end time"},
+                "description": {"type": "string", "description": "New description"},
+                "location": {"type": "string", "description": "New location"},
             },
-        ),
-        Tool(
-            name="drive_mkdir",
-            description="Create a folder in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Folder name"},
-                    "parent": {"type": "string", "description": "Parent folder ID (default: root)"},
-                },
-                "required": ["name"],
+            "required": ["event_id"],
+        },
+    ),
+    # DRIVE TOOLS
+    Tool(
+        name="drive_list_files",
+        description="List files in Google Drive folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "parent": {"type": "string", "description": "Parent folder ID (default: root)"}
+            }
+        },
+    ),
+    Tool(
+        name="drive_search",
+        description="Search files in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
             },
-        ),
-        Tool(
-            name="drive_delete",
-            description="Delete a file from Google Drive (moves to trash)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to delete"},
-                },
-                "required": ["file_id"],
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="drive_get_file",
+        description="Get file metadata from Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID"},
             },
-        ),
-        Tool(
-            name="drive_move",
-            description="Move a file to a different folder in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to move"},
-                    "parent": {"type": "string", "description": "Destination folder ID"},
-                },
-                "required": ["file_id", "parent"],
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_download",
+        description="Download a file from Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to download"},
+                "output": {"type": "string", "description": "Output path (optional)"},
             },
-        ),
-        Tool(
-            name="drive_rename",
-            description="Rename a file in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to rename"},
-                    "new_name": {"type": "string", "description": "New file name"},
-                },
-                "required": ["file_id", "new_name"],
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_upload",
+        description="Upload a file to Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Local file path to upload"},
+                "parent": {"type": "string", "description": "Parent folder ID (default: root)"},
             },
-        ),
-        Tool(
-            name="drive_share",
-            description="Share a file in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to share"},
-                    "email": {"type": "string", "description": "Email to share with"},
-                    "role": {"type": "string", "description": "Permission role (reader, writer, owner)", "enum": ["reader", "writer", "owner"], "default": "reader"},
-                },
-                "required": ["file_id", "email"],
+            "required": ["file_path"],
+        },
+    ),
+    Tool(
+        name="drive_mkdir",
+        description="Create a folder in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Folder name"},
+                "parent": {"type": "string", "description": "Parent folder ID (default: root)"},
             },
-        ),
-        Tool(
-            name="drive_permissions",
-            description="List permissions on a Google Drive file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID"},
-                },
-                "required": ["file_id"],
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="drive_delete",
+        description="Delete a file from Google Drive (moves to trash)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to delete"},
             },
-        ),
-        Tool(
-            name="drive_url",
-            description="Get web URL for a Google Drive file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID(s), comma-separated"},
-                },
-                "required": ["file_id"],
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_move",
+        description="Move a file to a different folder in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to move"},
+                "parent": {"type": "string", "description": "Destination folder ID"},
             },
-        ),
-        Tool(
-            name="drive_copy",
-            description="Copy a file in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID to copy"},
-                    "name": {"type": "string", "description": "Name for the copy"},
-                    "parent": {"type": "string", "description": "Parent folder ID to copy to (optional)"},
-                },
-                "required": ["file_id", "name"],
+            "required": ["file_id", "parent"],
+        },
+    ),
+    Tool(
+        name="drive_rename",
+        description="Rename a file in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to rename"},
+                "new_name": {"type": "string", "description": "New file name"},
             },
-        ),
-        Tool(
-            name="drive_unshare",
-            description="Remove a permission from a Google Drive file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID"},
-                    "permission_id": {"type": "string", "description": "Permission ID to remove"},
-                },
-                "required": ["file_id", "permission_id"],
+            "required": ["file_id", "new_name"],
+        },
+    ),
+    Tool(
+        name="drive_share",
+        description="Share a file in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to share"},
+                "email": {"type": "string", "description": "Email to share with"},
+                "role": {"type": "string", "description": "Permission role (reader, writer, owner)", "enum": ["reader", "writer", "owner"], "default": "reader"},
             },
-        ),
-        Tool(
-            name="drive_list_drives",
-            description="List shared drives (Team Drives) in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                },
+            "required": ["file_id", "email"],
+        },
+    ),
+    Tool(
+        name="drive_permissions",
+        description="List permissions on a Google Drive file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID"},
             },
-        ),
-        Tool(
-            name="drive_list_comments",
-            description="List comments on a Google Drive file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID"},
-                },
-                "required": ["file_id"],
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_url",
+        description="Get web URL for a Google Drive file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID(s), comma-separated"},
             },
-        ),
-        Tool(
-            name="drive_add_comment",
-            description="Add a comment to a Google Drive file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "string", "description": "File ID"},
-                    "content": {"type": "string", "description": "Comment content"},
-                },
-                "required": ["file_id", "content"],
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_copy",
+        description="Copy a file in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID to copy"},
+                "name": {"type": "string", "description": "Name for the copy"},
+                "parent": {"type": "string", "description": "Parent folder ID to copy to (optional)"},
             },
-        ),
-    ]
+            "required": ["file_id", "name"],
+        },
+    ),
+    Tool(
+        name="drive_unshare",
+        description="Remove a permission from a Google Drive file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID"},
+                "permission_id": {"type": "string", "description": "Permission ID to remove"},
+            },
+            "required": ["file_id", "permission_id"],
+        },
+    ),
+    Tool(
+        name="drive_list_drives",
+        description="List shared drives (Team Drives) in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+            },
+        },
+    ),
+    Tool(
+        name="drive_list_comments",
+        description="List comments on a Google Drive file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID"},
+            },
+            "required": ["file_id"],
+        },
+    ),
+    Tool(
+        name="drive_add_comment",
+        description="Add a comment to a Google Drive file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "string", "description": "File ID"},
+                "content": {"type": "string", "description": "Comment content"},
+            },
+            "required": ["file_id", "content"],
+        },
+    ),
+    Tool(
+        name="mcp_get_schema",
+        description="Get the full input schema of a tool before calling it",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tool_name": {"type": "string", "description": "Tool name"},
+            },
+            "required": ["tool_name"],
+        },
+    ),
+    Tool(
+        name="mcp_search_tools",
+        description="Find tools by keyword and return their full input schemas",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Keywords, e.g. 'share drive file'"},
+                "limit": {"type": "integer", "description": "Maximum number of tools", "default": 5},
+            },
+            "required": ["query"],
+        },
+    ),
+)
+
+# Every cached read accepts no_cache to force a fresh gogcli call
+for _tool in _TOOLS:
+    if _tool.name in _CACHED_READS:
+        _tool.inputSchema.setdefault("properties", {})["no_cache"] = {
+            "type": "boolean",
+            "description": "Bypass the short-lived read cache",
+            "default": False,
+        }
 
+# Full input schemas by tool name, served by mcp_get_schema
+_FULL_SCHEMAS: dict[str, dict[str, Any]] = {tool.name: tool.inputSchema for tool in _TOOLS}
+
+# One compiled validator per tool, reused for every call
+_VALIDATORS: dict[str, Any] = (
+    {name: Draft7Validator(schema) for name, schema in _FULL_SCHEMAS.items()}
+    if Draft7Validator is not None
+    else {}
+)
+
+# With MCP_LAZY_TOOL_SCHEMAS set, tools/list sends names and descriptions only
+# and clients fetch argument schemas on demand, keeping the listing small
+LAZY_TOOL_SCHEMAS = os.getenv("MCP_LAZY_TOOL_SCHEMAS", "").lower() in ("1", "true", "yes")
+
+# Meta tools keep their schemas in the lazy listing so clients can expand the rest
+_META_TOOLS = frozenset({"mcp_get_schema", "mcp_search_tools"})
+
+_TOOL_SUMMARIES: tuple[Tool, ...] = tuple(
+    tool if tool.name in _META_TOOLS else Tool(
+        name=tool.name,
+        description=f"{tool.description} (arguments: see mcp_get_schema)",
+        inputSchema={"type": "object"},
+    )
+    for tool in _TOOLS
+)
+
+
+def _words(text: str) -> frozenset[str]:
+    """Lowercase words of text, splitting tool names on underscores too"""
+    return frozenset(re.findall(r"[a-z0-9]+", text.lower()))
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls"""
-    account = arguments.get("account", None)
 
+# (tool, name words, description words) for mcp_search_tools
+_SEARCH_INDEX: tuple[tuple[Tool, frozenset[str], frozenset[str]], ...] = tuple(
+    (tool, _words(tool.name), _words(tool.description or "")) for tool in _TOOLS
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools"""
+    return list(_TOOL_SUMMARIES if LAZY_TOOL_SCHEMAS else _TOOLS)
+
+
+# Set inside workspace_batch sub-calls, which run concurrently under the parent
+# request's progressToken and would report interleaved, non-monotonic counts
+_in_batch_call: contextvars.ContextVar[bool] = contextvars.ContextVar("_in_batch_call", default=False)
+
+
+def _progress_reporter() -> LineCallback | None:
+    """
+    Build an on_line callback that reports listing progress to the client
+
+    Returns None outside a request, inside a workspace_batch sub-call, or when
+    the client sent no progressToken.
+    """
+    if _in_batch_call.get():
+        return None
     try:
-        # SYSTEM/STATUS TOOLS
-        if name == "gogcli_status":
-            # Use expect for keyring automation
-            auth_result = run_gogcli("auth", "status", [], account=None, timeout=10)
-            config_result = run_gogcli("config", "list", [], account=None, timeout=10)
-
-            status_info = {
-                "gogcli_bin": GOGCLI_BIN,
-                "default_account": DEFAULT_ACCOUNT or "not set",
-                "auth_status": "authenticated" if auth_result["success"] else "not authenticated",
-                "auth_output": auth_result.get("output", auth_result.get("error", "")),
-                "config": config_result.get("output", "config not available")
-            }
-            return [TextContent(type="text", text=json.dumps(status_info, indent=2))]
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
 
-        elif name == "gogcli_version":
-            result = run_gogcli("--version", "", [], account=None, timeout=10)
-            if result["success"]:
-                return [TextContent(type="text", text=result.get("output", result.get("error", "")))]
-            else:
-                return [TextContent(type="text", text=f"Error getting version: {result.get('error', '')}")]
+    async def report(lines: int) -> None:
+        if lines % PROGRESS_EVERY == 0:
+            await ctx.session.send_progress_notification(token, lines)
 
-        # GMAIL TOOLS
-        elif name == "gmail_send_email":
-            to = arguments["to"]
-            subject = arguments["subject"]
-            body = arguments["body"]
-            is_html = arguments.get("html", False)
+    return report
 
-            args = ["--to", to, "--subject", subject]
 
-            if is_html:
-                # FIXED: Use the confirmed working method for HTML
-                # --body-html with expect variable shell expansion
-                result = run_gogcli("gmail", "send", args, account, html_body=body)
-            else:
-                args.extend(["--body", body])
-                result = run_gogcli("gmail", "send", args, account)
+# Fixed responses, built once and shared (responses are never mutated)
+_EMAIL_SENT = TextContent(type="text", text="Email sent successfully!")
+_NO_LABEL_CHANGE = TextContent(type="text", text="Error: Must specify either 'labels' or 'remove'")
+
+
+def _json_text(obj: Any) -> str:
+    """Pretty-print a tool's JSON response"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _result_text(result: dict[str, Any]) -> str:
+    """A run_gogcli result's stdout, or its error"""
+    return result.get("output", "") if result["success"] else result.get("error", "")
 
-            if result["success"]:
-                return [TextContent(type="text", text=f"Email sent successfully!")]
-            else:
-                return [TextContent(type="text", text=f"Error: {result['error']}")]
-
-        elif name == "gmail_list_emails":
-            limit = arguments.get("limit", 10)
-            result = run_gogcli("gmail", "list", ["--limit", str(limit)], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_search_emails":
-            query = arguments["query"]
-            limit = arguments.get("limit", 10)
-            result = run_gogcli("gmail", "search", ["--query", query, "--limit", str(limit)], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_read_email":
-            msg_id = arguments["message_id"]
-            result = run_gogcli("gmail", "read", ["--id", msg_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_label_email":
-            msg_id = arguments["message_id"]
-            labels = arguments.get("labels", "")
-            remove = arguments.get("remove", "")
-
-            if labels:
-                result = run_gogcli("gmail", "label", ["--id", msg_id, "--add", labels], account)
-                return [TextContent(type="text", text=result.get("output", result["error"]))]
-            elif remove:
-                result = run_gogcli("gmail", "label", ["--id", msg_id, "--remove", remove], account)
-                return [TextContent(type="text", text=result.get("output", result["error"]))]
-            else:
-                return [TextContent(type="text", text="Error: Must specify either 'labels' or 'remove'")]
-
-        elif name == "gmail_archive_email":
-            msg_id = arguments["message_id"]
-            result = run_gogcli("gmail", "archive", ["--id", msg_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_delete_email":
-            msg_id = arguments["message_id"]
-            result = run_gogcli("gmail", "delete", ["--id", msg_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # SHEETS TOOLS
-        elif name == "sheets_create":
-            title = arguments["title"]
-            result = run_gogcli("sheets", "create", ["--title", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_read":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments.get("range", "A1")
-            result = run_gogcli("sheets", "get", ["--id", sheet_id, "--range", range_val], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_write":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments["range"]
-            data = arguments["data"]
-
-            # Try to parse as JSON first
-            try:
-                parsed_data = json.loads(data)
-                if isinstance(parsed_data, list):
-                    # Convert to CSV format
-                    csv_data = "\n".join([",".join(row) for row in parsed_data])
-                    data = csv_data
-            except:
-                pass  # Use as-is
-
-            result = run_gogcli("sheets", "update", ["--id", sheet_id, "--range", range_val, "--data", data], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_append":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments.get("range", "A1")
-            data = arguments["data"]
-
-            # Try to parse as JSON first
-            try:
-                parsed_data = json.loads(data)
-                if isinstance(parsed_data, list):
-                    csv_data = "\n".join([",".join(row) for row in parsed_data])
-                    data = csv_data
-            except:
-                pass
-
-            result = run_gogcli("sheets", "append", ["--id", sheet_id, "--range", range_val, "--data", data], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_delete":
-            sheet_id = arguments["spreadsheet_id"]
-            result = run_gogcli("sheets", "delete", ["--id", sheet_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # DOCS TOOLS
-        elif name == "docs_create":
-            title = arguments["title"]
-            content = arguments.get("content", "")
-
-            if content:
-                result = run_gogcli("docs", "create", ["--title", title, "--content", content], account)
-            else:
-                result = run_gogcli("docs", "create", ["--title", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "docs_read":
-            doc_id = arguments["doc_id"]
-            result = run_gogcli("docs", "get", ["--id", doc_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "docs_append":
-            doc_id = arguments["doc_id"]
-            text = arguments["text"]
-            result = run_gogcli("docs", "append", ["--id", doc_id, "--text", text], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "docs_delete":
-            doc_id = arguments["doc_id"]
-            result = run_gogcli("docs", "delete", ["--id", doc_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # SLIDES TOOLS
-        elif name == "slides_create":
-            title = arguments["title"]
-            result = run_gogcli("slides", "create", ["--title", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "slides_read":
-            pres_id = arguments["presentation_id"]
-            result = run_gogcli("slides", "get", ["--id", pres_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "slides_delete":
-            pres_id = arguments["presentation_id"]
-            result = run_gogcli("slides", "delete", ["--id", pres_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # CALENDAR TOOLS
-        elif name == "calendar_create_event":
-            title = arguments["title"]
-            start = arguments["start"]
-            end = arguments["end"]
-
-            args = ["--title", title, "--start", start, "--end", end]
-
-            if arguments.get("description"):
-                args.extend(["--description", arguments["description"]])
-            if arguments.get("location"):
-                args.extend(["--location", arguments["location"]])
-            if arguments.get("attendees"):
-                args.extend(["--attendees", arguments["attendees"]])
-
-            result = run_gogcli("calendar", "create", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "calendar_list_events":
-            start = arguments.get("start", "")
-            end = arguments.get("end", "")
-            limit = arguments.get("limit", 10)
-
-            args = ["--limit", str(limit)]
-            if start:
-                args.extend(["--start", start])
-            if end:
-                args.extend(["--end", end])
-
-            result = run_gogcli("calendar", "list", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "calendar_delete_event":
-            event_id = arguments["event_id"]
-            result = run_gogcli("calendar", "delete", ["--id", event_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "calendar_update_event":
-            event_id = arguments["event_id"]
-            args = ["--id", event_id]
-
-            if arguments.get("title"):
-                args.extend(["--title", arguments["title"]])
-            if arguments.get("start"):
-                args.extend(["--start", arguments["start"]])
-            if arguments.get("end"):
-                args.extend(["--end", arguments["end"]])
-            if arguments.get("description"):
-                args.extend(["--description", arguments["description"]])
-            if arguments.get("location"):
-                args.extend(["--location", arguments["location"]])
-
-            result = run_gogcli("calendar", "update", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # DRIVE TOOLS
-        elif name == "drive_list_files":
-            import sys
-            parent_id = arguments.get("parent", "")
-            print(f"[MCP DEBUG] drive_list_files called with parent={parent_id}", file=sys.stderr, flush=True)
-            args = []
-            if parent_id:
-                args.extend(["--parent", parent_id])
-            print(f"[MCP DEBUG] args={args}", file=sys.stderr, flush=True)
-            result = run_gogcli("drive", "ls", args, account)
-            print(f"[MCP DEBUG] result success={result.get('success')}", file=sys.stderr, flush=True)
-            print(f"[MCP DEBUG] result output={result.get('output', 'N/A')[:100]}", file=sys.stderr, flush=True)
-            print(f"[MCP DEBUG] result error={result.get('error', 'N/A')[:100]}", file=sys.stderr, flush=True)
-            # formar el comando que se va a ejecutar en gogcli
-            print(f"[MCP DEBUG] Running gogcli command: gogcli drive ls {' '.join(args)}", file=sys.stderr, flush=True)
-            if result.get("success"):
-                return [TextContent(type="text", text=result.get("output", "No output"))]
-            else:
-                return [TextContent(type="text", text=f"Error: {result.get('error', 'Unknown error')}")]
-
-        elif name == "drive_search":
-            query = arguments["query"]
-            result = run_gogcli("drive", "search", [query], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_get_file":
-            file_id = arguments["file_id"]
-            result = run_gogcli("drive", "get", [file_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_download":
-            file_id = arguments["file_id"]
-            output = arguments.get("output", "")
-            args = [file_id]
-            if output:
-                args.extend(["--output", output])
-            result = run_gogcli("drive", "download", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_upload":
-            file_path = arguments["file_path"]
-            parent = arguments.get("parent", "")
-            args = [file_path]
-            if parent:
-                args.extend([f"--folder={parent}"])
-            result = run_gogcli("drive", "upload", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_mkdir":
-            name = arguments["name"]
-            parent = arguments.get("parent", "")
-            args = [name]
-            if parent:
-                args.extend([f"--folder={parent}"])
-            result = run_gogcli("drive", "mkdir", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_delete":
-            file_id = arguments["file_id"]
-            result = run_gogcli("drive", "delete", [file_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_move":
-            file_id = arguments["file_id"]
-            parent = arguments.get("parent", "")
-            result = run_gogcli("drive", "move", [file_id, f"--folder={parent}"], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_rename":
-            file_id = arguments["file_id"]
-            new_name = arguments["new_name"]
-            result = run_gogcli("drive", "rename", [file_id, new_name], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_share":
-            file_id = arguments["file_id"]
-            email = arguments["email"]
-            role = arguments.get("role", "reader")
-            result = run_gogcli("drive", "share", [file_id, "--email", email, "--role", role], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_permissions":
-            file_id = arguments["file_id"]
-            result = run_gogcli("drive", "permissions", [file_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_url":
-            file_id = arguments["file_id"]
-            result = run_gogcli("drive", "url", [file_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_copy":
-            file_id = arguments["file_id"]
-            name = arguments["name"]
-            parent = arguments.get("parent", "")
-            args = [file_id, name]
-            if parent:
-                args.extend([f"--folder={parent}"])
-            result = run_gogcli("drive", "copy", args, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_unshare":
-            file_id = arguments["file_id"]
-            permission_id = arguments["permission_id"]
-            result = run_gogcli("drive", "unshare", [file_id, permission_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_list_drives":
-            result = run_gogcli("drive", "drives", [], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_list_comments":
-            file_id = arguments["file_id"]
-            result = run_gogcli("drive", "comments", ["list", file_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "drive_add_comment":
-            file_id = arguments["file_id"]
-            content = arguments["content"]
-            result = run_gogcli("drive", "comments", ["add", file_id, "--content", content], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
 
+def _reply(result: dict[str, Any]) -> list[TextContent]:
+    """Wrap a run_gogcli result as tool output"""
+    return [TextContent(type="text", text=_result_text(result))]
+
+
+# SYSTEM/STATUS TOOLS
+
+async def _gogcli_status(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    auth_result, config_result = await asyncio.gather(
+        run_gogcli("auth", "status", [], account=None, timeout=10),
+        run_gogcli("config", "list", [], account=None, timeout=10),
+    )
+
+    status_info = {
+        "gogcli_bin": GOGCLI_BIN,
+        "default_account": DEFAULT_ACCOUNT or "not set",
+        "auth_status": "authenticated" if auth_result["success"] else "not authenticated",
+        "auth_output": _result_text(auth_result),
+        "config": config_result.get("output", "config not available")
+    }
+    return [TextContent(type="text", text=_json_text(status_info))]
+
+
+async def _gogcli_version(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    result = await get_gogcli_version()
+    if result["success"]:
+        return _reply(result)
+    else:
+        return [TextContent(type="text", text=f"Error getting version: {result.get('error', '')}")]
+
+
+# GMAIL TOOLS
+
+async def _gmail_send_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    to = arguments["to"]
+    subject = arguments["subject"]
+    body = arguments["body"]
+    is_html = arguments.get("html", False)
+
+    args = ["--to", to, "--subject", subject]
+
+    if is_html:
+        # HTML body is piped in (--body-html @/dev/fd/N)
+        result = await run_gogcli("gmail", "send", args, account, html_body=body)
+    else:
+        args.extend(["--body", body])
+        result = await run_gogcli("gmail", "send", args, account)
+
+    if result["success"]:
+        return [_EMAIL_SENT]
+    else:
+        return [TextContent(type="text", text=f"Error: {result['error']}")]
+
+
+async def _gmail_label_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    msg_id = arguments["message_id"]
+    labels = arguments.get("labels", "")
+    remove = arguments.get("remove", "")
+
+    if labels:
+        return _reply(await run_gogcli("gmail", "label", ["--id", msg_id, "--add", labels], account))
+    elif remove:
+        return _reply(await run_gogcli("gmail", "label", ["--id", msg_id, "--remove", remove], account))
+    else:
+        return [_NO_LABEL_CHANGE]
+
+
+async def _gmail_batch(
+    message_ids: list[str],
+    run: Callable[[str], Awaitable[dict[str, Any]]],
+) -> list[TextContent]:
+    """Run one gogcli call per message, a few at a time, and report them as a JSON array"""
+    # The schema check only runs with the validation extra; without it a string
+    # would be iterated one gogcli call per character
+    if not isinstance(message_ids, list) or not all(isinstance(msg_id, str) for msg_id in message_ids):
+        return [TextContent(type="text", text="Error: message_ids must be an array of message ID strings")]
+    if len(message_ids) > BATCH_MAX_MESSAGES:
+        return [TextContent(
+            type="text",
+            text=f"Error: At most {BATCH_MAX_MESSAGES} message IDs per batch",
+        )]
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run_one(msg_id: str) -> dict[str, Any]:
+        async with semaphore:
+            result = await run(msg_id)
+        entry = {"message_id": msg_id, "success": result["success"]}
+        if result["success"]:
+            entry["output"] = result.get("output", "")
         else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            entry["error"] = result.get("error", "")
+        return entry
 
+    results = await asyncio.gather(*(run_one(msg_id) for msg_id in message_ids))
+    return [TextContent(type="text", text=_json_text(results))]
+
+
+async def _gmail_batch_read(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    async def read(msg_id: str) -> dict[str, Any]:
+        # Shares cache entries with gmail_read_email
+        return await _cached_run(
+            "gmail_read_email", {"message_id": msg_id}, "gmail", "read", ["--id", msg_id], account
+        )
+
+    return await _gmail_batch(arguments["message_ids"], read)
+
+
+async def _gmail_batch_label(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    labels = arguments.get("labels", "")
+    remove = arguments.get("remove", "")
+
+    if labels:
+        label_args = ["--add", labels]
+    elif remove:
+        label_args = ["--remove", remove]
+    else:
+        return [_NO_LABEL_CHANGE]
+
+    async def label(msg_id: str) -> dict[str, Any]:
+        result = await run_gogcli("gmail", "label", ["--id", msg_id, *label_args], account)
+        _invalidate("gmail_label_email", {"message_id": msg_id})
+        return result
+
+    return await _gmail_batch(arguments["message_ids"], label)
+
+
+async def _gmail_archive_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    msg_id = arguments["message_id"]
+    return _reply(await run_gogcli("gmail", "archive", ["--id", msg_id], account))
+
+
+async def _gmail_delete_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    msg_id = arguments["message_id"]
+    return _reply(await run_gogcli("gmail", "delete", ["--id", msg_id], account))
+
+
+async def _gmail_batch_archive(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    async def archive(msg_id: str) -> dict[str, Any]:
+        result = await run_gogcli("gmail", "archive", ["--id", msg_id], account)
+        _invalidate("gmail_archive_email", {"message_id": msg_id})
+        return result
+
+    return await _gmail_batch(arguments["message_ids"], archive)
+
+
+async def _gmail_batch_delete(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    async def delete(msg_id: str) -> dict[str, Any]:
+        result = await run_gogcli("gmail", "delete", ["--id", msg_id], account)
+        _invalidate("gmail_delete_email", {"message_id": msg_id})
+        return result
+
+    return await _gmail_batch(arguments["message_ids"], delete)
+
+
+# SHEETS TOOLS
+
+def _rows_to_csv(rows: list) -> str:
+    """
+    Convert a JSON array of rows to CSV text for gogcli's --data
+
+    Cells are quoted as needed, so commas, quotes and newlines survive, and
+    non-string cells are stringified. A bare value is treated as a one-cell row.
+    """
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(
+        row if isinstance(row, list) else [row] for row in rows
+    )
+    return buf.getvalue().rstrip("\n")
+
+
+def _sheet_data(data: Any) -> Any:
+    """A JSON array of rows is converted to CSV; anything else is sent as-is"""
+    # Only a string opening with "[" can parse to a list, so plain CSV skips the parse
+    if not isinstance(data, str) or not data.lstrip().startswith("["):
+        return data
+    try:
+        parsed_data = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return data
+    return _rows_to_csv(parsed_data) if isinstance(parsed_data, list) else data
+
+
+async def _sheets_write(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    sheet_id = arguments["spreadsheet_id"]
+    range_val = arguments["range"]
+    data = _sheet_data(arguments["data"])
+    return _reply(await run_gogcli("sheets", "update", ["--id", sheet_id, "--range", range_val, "--data", data], account))
+
+
+async def _sheets_append(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    sheet_id = arguments["spreadsheet_id"]
+    range_val = arguments.get("range", "A1")
+    data = _sheet_data(arguments["data"])
+    return _reply(await run_gogcli("sheets", "append", ["--id", sheet_id, "--range", range_val, "--data", data], account))
+
+
+# DRIVE TOOLS
+
+async def _drive_list_files(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    parent_id = arguments.get("parent", "")
+    args = []
+    if parent_id:
+        args.extend(["--parent", parent_id])
+    result = await _cached_run("drive_list_files", arguments, "drive", "ls", args, account)
+    # Keeps its own reply text: "Error: " on failure, "No output" when empty
+    if result["success"]:
+        return [TextContent(type="text", text=result["output"] or "No output")]
+    return [TextContent(type="text", text=f"Error: {result.get('error') or 'Unknown error'}")]
+
+
+async def _drive_download(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    file_id = arguments["file_id"]
+    output = arguments.get("output", "")
+    args = [file_id]
+    if output:
+        args.extend(["--output", output])
+    return _reply(await run_gogcli("drive", "download", args, account))
+
+
+async def _drive_upload(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    file_path = arguments["file_path"]
+    parent = arguments.get("parent", "")
+    args = [file_path]
+    if parent:
+        args.extend([f"--folder={parent}"])
+    return _reply(await run_gogcli("drive", "upload", args, account))
+
+
+async def _drive_list_comments(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    file_id = arguments["file_id"]
+    return _reply(await _cached_run("drive_list_comments", arguments, "drive", "comments", ["list", file_id], account))
+
+
+async def _drive_add_comment(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    file_id = arguments["file_id"]
+    content = arguments["content"]
+    return _reply(await run_gogcli("drive", "comments", ["add", file_id, "--content", content], account))
+
+
+async def _mcp_get_schema(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    tool_name = arguments["tool_name"]
+    schema = _FULL_SCHEMAS.get(tool_name)
+    if schema is None:
+        return [TextContent(type="text", text=f"Unknown tool: {tool_name}")]
+    return [TextContent(type="text", text=_json_text(schema))]
+
+
+async def _mcp_search_tools(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    terms = _words(arguments["query"])
+    limit = arguments.get("limit", 5)
+
+    # A word in the tool name counts more than one in its description
+    scored = []
+    for tool, name_words, description_words in _SEARCH_INDEX:
+        score = 3 * len(terms & name_words) + len(terms & description_words)
+        if score:
+            scored.append((score, tool))
+    scored.sort(key=lambda item: item[0], reverse=True)
+
+    matches = [
+        {"name": tool.name, "description": tool.description, "inputSchema": tool.inputSchema}
+        for _, tool in scored[:limit]
+    ]
+    return [TextContent(type="text", text=_json_text(matches))]
+
+
+async def _workspace_batch(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run_call(call: dict[str, Any]) -> list[TextContent]:
+        name = call["name"]
+        if name == "workspace_batch":
+            raise ValueError("workspace_batch calls cannot be nested")
+        call_arguments = dict(call.get("arguments") or {})
+        if account is not None:
+            call_arguments.setdefault("account", account)
+        # Each gathered call runs in its own task, so this stays local to it
+        _in_batch_call.set(True)
+        async with semaphore:
+            return await handle_call_tool(name, call_arguments)
+
+    calls = arguments["calls"]
+    responses = await asyncio.gather(*(run_call(call) for call in calls), return_exceptions=True)
+
+    results = []
+    for call, response in zip(calls, responses):
+        entry = {"name": call.get("name") if isinstance(call, dict) else None}
+        if isinstance(response, BaseException):
+            entry["error"] = str(response)
+        else:
+            entry["output"] = "\n".join(content.text for content in response)
+        results.append(entry)
+    return [TextContent(type="text", text=_json_text(results))]
+
+
+ToolHandler = Callable[[dict[str, Any], str | None], Awaitable[list[TextContent]]]
+
+
+# DECLARATIVE TOOLS
+
+class ToolSpec(NamedTuple):
+    """A tool that maps its arguments straight onto one gogcli command's flags"""
+    service: str
+    command: str
+    # Arguments passed bare, in order, before any flags
+    positional: tuple[str, ...] = ()
+    # (argument, flag) pairs that must be present; a flag ending in "=" takes
+    # its value in the same token (--folder=ID)
+    required: tuple[tuple[str, str], ...] = ()
+    # (argument, flag, default) triples, always passed
+    defaults: tuple[tuple[str, str, Any], ...] = ()
+    # (argument, flag) pairs, skipped when missing or empty
+    optional: tuple[tuple[str, str], ...] = ()
+    # Serve repeat calls from the read cache
+    cached: bool = False
+    # Report output lines as MCP progress notifications
+    progress: bool = False
+
+
+_TOOL_SPECS: dict[str, ToolSpec] = {
+    "gmail_list_emails": ToolSpec(
+        "gmail", "list", defaults=(("limit", "--limit", 10),), cached=True, progress=True,
+    ),
+    "gmail_search_emails": ToolSpec(
+        "gmail", "search", required=(("query", "--query"),), defaults=(("limit", "--limit", 10),), cached=True,
+    ),
+    "gmail_read_email": ToolSpec("gmail", "read", required=(("message_id", "--id"),), cached=True),
+    "sheets_create": ToolSpec("sheets", "create", required=(("title", "--title"),)),
+    "sheets_read": ToolSpec(
+        "sheets", "get", required=(("spreadsheet_id", "--id"),), defaults=(("range", "--range", "A1"),), cached=True,
+    ),
+    "sheets_delete": ToolSpec("sheets", "delete", required=(("spreadsheet_id", "--id"),)),
+    "docs_create": ToolSpec(
+        "docs", "create", required=(("title", "--title"),), optional=(("content", "--content"),),
+    ),
+    "docs_read": ToolSpec("docs", "get", required=(("doc_id", "--id"),), cached=True),
+    "docs_append": ToolSpec("docs", "append", required=(("doc_id", "--id"), ("text", "--text"))),
+    "docs_delete": ToolSpec("docs", "delete", required=(("doc_id", "--id"),)),
+    "slides_create": ToolSpec("slides", "create", required=(("title", "--title"),)),
+    "slides_read": ToolSpec("slides", "get", required=(("presentation_id", "--id"),), cached=True),
+    "slides_delete": ToolSpec("slides", "delete", required=(("presentation_id", "--id"),)),
+    "calendar_create_event": ToolSpec(
+        "calendar", "create",
+        required=(("title", "--title"), ("start", "--start"), ("end", "--end")),
+        optional=(("description", "--description"), ("location", "--location"), ("attendees", "--attendees")),
+    ),
+    "calendar_list_events": ToolSpec(
+        "calendar", "list",
+        defaults=(("limit", "--limit", 10),),
+        optional=(("start", "--start"), ("end", "--end")),
+        cached=True, progress=True,
+    ),
+    "calendar_delete_event": ToolSpec("calendar", "delete", required=(("event_id", "--id"),)),
+    "calendar_update_event": ToolSpec(
+        "calendar", "update",
+        required=(("event_id", "--id"),),
+        optional=(
+            ("title", "--title"), ("start", "--start"), ("end", "--end"),
+            ("description", "--description"), ("location", "--location"),
+        ),
+    ),
+    "drive_search": ToolSpec("drive", "search", positional=("query",)),
+    "drive_get_file": ToolSpec("drive", "get", positional=("file_id",), cached=True),
+    "drive_mkdir": ToolSpec("drive", "mkdir", positional=("name",), optional=(("parent", "--folder="),)),
+    "drive_delete": ToolSpec("drive", "delete", positional=("file_id",)),
+    "drive_move": ToolSpec("drive", "move", positional=("file_id",), required=(("parent", "--folder="),)),
+    "drive_rename": ToolSpec("drive", "rename", positional=("file_id", "new_name")),
+    "drive_share": ToolSpec(
+        "drive", "share",
+        positional=("file_id",),
+        required=(("email", "--email"),),
+        defaults=(("role", "--role", "reader"),),
+    ),
+    "drive_permissions": ToolSpec("drive", "permissions", positional=("file_id",), cached=True),
+    "drive_url": ToolSpec("drive", "url", positional=("file_id",), cached=True),
+    "drive_copy": ToolSpec(
+        "drive", "copy", positional=("file_id", "name"), optional=(("parent", "--folder="),),
+    ),
+    "drive_unshare": ToolSpec("drive", "unshare", positional=("file_id", "permission_id")),
+    "drive_list_drives": ToolSpec("drive", "drives"),
+}
+
+
+def _flag(flag: str, value: Any) -> tuple[Any, ...]:
+    """A flag and its value as argv tokens"""
+    return (f"{flag}{value}",) if flag.endswith("=") else (flag, value)
+
+
+def _spec_args(spec: ToolSpec, arguments: dict[str, Any]) -> list[str]:
+    """Turn tool arguments into gogcli arguments as described by spec"""
+    args = [arguments[key] for key in spec.positional]
+    args += [token for key, flag in spec.required for token in _flag(flag, arguments[key])]
+    args += [token for key, flag, default in spec.defaults for token in _flag(flag, str(arguments.get(key, default)))]
+    args += [token for key, flag in spec.optional if (value := arguments.get(key)) for token in _flag(flag, value)]
+    return args
+
+
+def _spec_handler(name: str, spec: ToolSpec) -> ToolHandler:
+    """Build the handler for a declarative tool"""
+    async def handler(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+        args = _spec_args(spec, arguments)
+        on_line = _progress_reporter() if spec.progress else None
+        if spec.cached:
+            result = await _cached_run(name, arguments, spec.service, spec.command, args, account, on_line=on_line)
+        else:
+            result = await run_gogcli(spec.service, spec.command, args, account, on_line=on_line)
+        return _reply(result)
+
+    return handler
+
+
+# Tool name -> handler; handle_call_tool does a single dict lookup
+_HANDLERS: dict[str, ToolHandler] = {
+    "gogcli_status": _gogcli_status,
+    "gogcli_version": _gogcli_version,
+    "workspace_batch": _workspace_batch,
+    "mcp_get_schema": _mcp_get_schema,
+    "mcp_search_tools": _mcp_search_tools,
+    "gmail_send_email": _gmail_send_email,
+    "gmail_label_email": _gmail_label_email,
+    "gmail_batch_read": _gmail_batch_read,
+    "gmail_batch_label": _gmail_batch_label,
+    "gmail_archive_email": _gmail_archive_email,
+    "gmail_delete_email": _gmail_delete_email,
+    "gmail_batch_archive": _gmail_batch_archive,
+    "gmail_batch_delete": _gmail_batch_delete,
+    "sheets_write": _sheets_write,
+    "sheets_append": _sheets_append,
+    "drive_list_files": _drive_list_files,
+    "drive_download": _drive_download,
+    "drive_upload": _drive_upload,
+    "drive_list_comments": _drive_list_comments,
+    "drive_add_comment": _drive_add_comment,
+    **{name: _spec_handler(name, spec) for name, spec in _TOOL_SPECS.items()},
+}
+
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls"""
+    logger.debug("tool=%s args=%r", name, arguments)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        error = next(validator.iter_errors(arguments), None)
+        if error is not None:
+            return [TextContent(type="text", text=f"Invalid arguments for {name}: {error.message}")]
+
+    try:
+        response = await handler(arguments, arguments.get("account", None))
+        if name in _INVALIDATING_WRITES:
+            _invalidate(name, arguments)
+        return response
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -1056,158 +1668,264 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 # MAIN ENTRY POINT
 # =============================================
 
+# Opt-in: make one cheap authenticated gogcli call at startup, so the first
+# real tool call doesn't pay for loading and refreshing the OAuth token
+GOGCLI_WARMUP = os.getenv("GOGCLI_WARMUP", "").lower() in ("1", "true", "yes")
+
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def warm_up() -> None:
+    """Run a lightweight Drive call so gogcli's token is fresh; failures only warn"""
+    result = await run_gogcli("drive", "drives", [], account=DEFAULT_ACCOUNT, timeout=10)
+    if not result["success"]:
+        logger.warning("gogcli warm-up failed: %s", result.get("error", ""))
+
+
+def start_warm_up() -> None:
+    """Schedule warm_up() in the background if GOGCLI_WARMUP is set"""
+    if GOGCLI_WARMUP:
+        task = asyncio.create_task(warm_up())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+# Static, so built once; must follow the handler registrations above, which
+# determine the advertised capabilities
+_INIT_OPTS = InitializationOptions(
+    server_name="google-workspace-gogcli-server",
+    server_version="0.2.0",
+    capabilities=server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    ),
+)
+# The SSE transport has always advertised its own version
+_SSE_INIT_OPTS = _INIT_OPTS.model_copy(update={"server_version": "0.3.0"})
+
+
+# Seconds a /health probe result is reused, so frequent pings don't each spawn gogcli
+HEALTH_CACHE_TTL = 15
+# (expiry on the monotonic clock, auth status) of the last probe
+_health_cache: tuple[float, str] = (0.0, "")
+
+
+async def _cached_gogcli_auth() -> str:
+    """_probe_gogcli_auth, reusing its result for HEALTH_CACHE_TTL seconds"""
+    global _health_cache
+    expires, auth_status = _health_cache
+    now = time.monotonic()
+    if now < expires:
+        return auth_status
+    auth_status = await _probe_gogcli_auth()
+    _health_cache = (now + HEALTH_CACHE_TTL, auth_status)
+    return auth_status
+
+
+async def _probe_gogcli_auth(timeout: float = 5) -> str:
+    """
+    Check gogcli for the /health endpoint without blocking the event loop
+
+    Runs outside _GOGCLI_SEM so a busy server still answers health checks.
+
+    Returns:
+        "authenticated", "not_authenticated", or "error" if gogcli could not
+        be run or did not answer in time
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            gogcli_executable(), "auth", "status",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,  # only the exit status is used
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False,  # posix_spawn fast path, as in run_gogcli
+        )
+    except OSError:
+        return "error"
+
+    try:
+        returncode = await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return "error"
+    return "authenticated" if returncode == 0 else "not_authenticated"
+
+
 def main_server_only(port: int = DEFAULT_PORT, detach: bool = False):
     """Run the server in SSE mode on specified port"""
+    # SSE-only dependencies are imported here so stdio mode never loads them
     from mcp.server.sse import SseServerTransport
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import JSONResponse, Response
     import uvicorn
-    import asyncio
 
     # Create SSE transport
     sse_transport = SseServerTransport("/messages")
 
-    # ASGI app that handles both SSE and POST endpoints
+    async def health(scope, receive, send):
+        auth_status = await _cached_gogcli_auth()
+        gogcli_ok = auth_status == "authenticated"
+
+        response = JSONResponse({
+            "status": "ok",
+            "server": "google-workspace-gogcli-server",
+            "version": "0.4.0",
+            "gogcli": "ok" if gogcli_ok else "error",
+            "auth": auth_status,
+            "account": DEFAULT_ACCOUNT or "default"
+        })
+        await response(scope, receive, send)
+
+    async def sse(scope, receive, send):
+        # SSE endpoint - handle MCP connection
+        async with sse_transport.connect_sse(scope, receive, send) as streams:
+            await server.run(streams[0], streams[1], _SSE_INIT_OPTS)
+
+    async def messages(scope, receive, send):
+        # POST endpoint for SSE messages - delegate to transport
+        if scope["method"] != "POST":
+            await not_found(scope, receive, send)
+            return
+        try:
+            await sse_transport.handle_post_message(scope, receive, send)
+        except Exception:
+            # Silently handle client disconnects and other errors
+            pass
+
+    async def not_found(scope, receive, send):
+        await Response("Not Found", status_code=404)(scope, receive, send)
+
+    routes = {
+        "/health": health,
+        "/sse": sse,
+        "/messages": messages,
+    }
+
+    # Bare ASGI app: three fixed paths need no router
     async def app(scope, receive, send):
         if scope["type"] == "http":
-            path = scope["path"]
-
-            if path == "/health":
-                # Health check endpoint
-                from starlette.responses import JSONResponse
-
-                # Check gogcli availability
-                try:
-                    result = subprocess.run(
-                        [GOGCLI_BIN, "auth", "status"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    gogcli_ok = result.returncode == 0
-                    auth_status = "authenticated" if gogcli_ok else "not_authenticated"
-                except:
-                    gogcli_ok = False
-                    auth_status = "error"
-
-                response = JSONResponse({
-                    "status": "ok",
-                    "server": "google-workspace-gogcli-server",
-                    "version": "0.4.0",
-                    "gogcli": "ok" if gogcli_ok else "error",
-                    "auth": auth_status,
-                    "account": DEFAULT_ACCOUNT or "default"
-                })
-                await response(scope, receive, send)
-
-            elif path == "/sse":
-                # SSE endpoint - handle MCP connection
-                async with sse_transport.connect_sse(scope, receive, send) as streams:
-                    await server.run(
-                        streams[0],
-                        streams[1],
-                        InitializationOptions(
-                            server_name="google-workspace-gogcli-server",
-                            server_version="0.3.0",
-                            capabilities=server.get_capabilities(
-                                notification_options=NotificationOptions(),
-                                experimental_capabilities={},
-                            ),
-                        ),
-                    )
-
-            elif path == "/messages" and scope["method"] == "POST":
-                # POST endpoint for SSE messages - delegate to transport
-                try:
-                    await sse_transport.handle_post_message(scope, receive, send)
-                except Exception:
-                    # Silently handle client disconnects and other errors
-                    pass
-
-            else:
-                # 404
-                from starlette.responses import Response
-                response = Response("Not Found", status_code=404)
-                await response(scope, receive, send)
-
-    # Wrap app with CORS middleware using Starlette
-    from starlette.applications import Starlette
-    from starlette.middleware.cors import CORSMiddleware
-    from starlette.routing import Mount
-
-    # Create a wrapper Starlette app with CORS
-    starlette_app = Starlette(routes=[
-        Mount("/", app=app)
-    ])
-
-    # Add CORS middleware
-    starlette_app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
+            await routes.get(scope["path"], not_found)(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    start_warm_up()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    # CORS: explicit origins may send credentials; the "*" default must not,
+    # or Starlette would echo back any caller's Origin
+    allowed_origins = [
+        origin.strip()
+        for origin in os.getenv("MCP_ALLOWED_ORIGINS", "*").split(",")
+        if origin.strip()
+    ]
+    app = CORSMiddleware(
+        app,
+        allow_origins=allowed_origins,
+        allow_credentials="*" not in allowed_origins,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    # Use the wrapped app
-    app = starlette_app
-
-    print(f"\n🚀 Google Workspace MCP Server (gogcli backend)")
+    print("\n🚀 Google Workspace MCP Server (gogcli backend)")
     print(f"📡 Server running on http://localhost:{port}/sse")
     print(f"📧 Using gogcli with account: {DEFAULT_ACCOUNT or 'default'}")
-    print(f"🔧 Direct execution (no keyring/expect)")
+    print("🔧 Direct execution (no keyring/expect)")
+
+    def serve():
+        # loop/http "auto" pick uvloop and httptools when the speedups extra is
+        # installed. A single worker: SSE sessions live in this process, so a
+        # /messages POST must reach the worker holding its /sse stream.
+        uvicorn.run(
+            app, host="0.0.0.0", port=port, loop="auto", http="auto",
+            log_level="warning", access_log=False,
+        )
 
     if detach:
         # Run in background (detached mode)
-        import sys
-        print(f"\n✅ Server starting in background mode...")
-        print(f"🛑 To stop: pkill -f 'google_workspace_mcp.server_gogcli'")
+        print("\n✅ Server starting in background mode...")
+        print("🛑 To stop: pkill -f 'google_workspace_mcp.server_gogcli'")
         sys.stdout.flush()
         sys.stderr.flush()
 
-        # Daemonize: fork twice
-        if os.fork() > 0:
-            os._exit(0)
-        os.setsid()
-        if os.fork() > 0:
-            os._exit(0)
-
-        # Redirect stdin/stdout/stderr to /dev/null
-        sys.stdin = open(os.devnull, 'r')
-        sys.stdout = open(os.devnull, 'w')
-        sys.stderr = open(os.devnull, 'w')
+        # Daemonize before uvicorn creates its event loop, so the loop and its
+        # signal handlers only ever exist in the daemon process
+        try:
+            import daemon
+        except ImportError:
+            daemon = None
+
+        if daemon is not None:
+            # python-daemon also closes inherited fds and redirects stdio to /dev/null
+            with daemon.DaemonContext(working_directory=os.getcwd(), umask=0o022):
+                serve()
+            return
+
+        # Fallback without python-daemon: start this file again in the foreground,
+        # in a new session with stdio on /dev/null. posix_spawn starts a fresh
+        # interpreter instead of forking (and copying) this fully imported one.
+        pid = os.posix_spawn(
+            sys.executable,
+            [sys.executable, os.path.abspath(__file__), "--server-only", "--port", str(port)],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
+            setsid=True,
+        )
+        print(f"📄 PID: {pid}")
+        return
     else:
-        print(f"\nPress Ctrl+C to stop\n")
+        print("\nPress Ctrl+C to stop\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="warning")
+    serve()
 
 
 async def main():
     """Main entry point for stdio mode"""
+    start_warm_up()
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="google-workspace-gogcli-server",
-                server_version="0.2.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
+        await server.run(read_stream, write_stream, _INIT_OPTS)
 
 
-if __name__ == "__main__":
-    import argparse
+def _run_stdio():
+    """Run the stdio server, on uvloop when it is installed (pip install .[speedups])"""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main())
+            return
+    asyncio.run(main())
 
-    parser = argparse.ArgumentParser(description="Google Workspace MCP Server (gogcli backend)")
-    parser.add_argument("--server-only", action="store_true", help="Run in SSE server mode")
-    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port for SSE server (default: {DEFAULT_PORT})")
-    parser.add_argument("--detach", action="store_true", help="Run in background/detached mode")
 
-    args = parser.parse_args()
+if __name__ == "__main__":
+    # Diagnostics go to stderr; stdout carries the MCP stream in stdio mode
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), stream=sys.stderr)
 
-    if args.server_only:
-        main_server_only(args.port, args.detach)
+    if len(sys.argv) == 1:
+        # Plain stdio launch (how MCP clients start us): no options to parse
+        _run_stdio()
     else:
-        asyncio.run(main())
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Google Workspace MCP Server (gogcli backend)")
+        parser.add_argument("--server-only", action="store_true", help="Run in SSE server mode")
+        parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port for SSE server (default: {DEFAULT_PORT})")
+        parser.add_argument("--detach", action="store_true", help="Run in background/detached mode")
+
+        args = parser.parse_args()
+
+        if args.server_only:
+            main_server_only(args.port, args.detach)
+        else:
+            _run_stdio()
@@ -6,9 +6,14 @@ using direct Google APIs with OAuth 2.0 authentication.
 """
 
 import asyncio
+import functools
+import logging
 import os
+import threading
+from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
@@ -20,93 +25,138 @@ from mcp.types import (
 from google_workspace_mcp.auth import GoogleAuth, get_auth
 
 
+logger = logging.getLogger(__name__)
+
 # Create server instance
 server = Server("google-workspace-mcp-server")
 
-# Global auth instance
-_auth: GoogleAuth | None = None
-
 
 def get_auth_instance() -> GoogleAuth:
-    """Get or create the auth instance"""
-    global _auth
-    if _auth is None:
-        _auth = GoogleAuth()
-    return _auth
+    """Get the process-wide auth instance"""
+    return get_auth()
 
 
 # =============================================
 # SERVICES
 # =============================================
 
-async def get_gmail_service():
-    """Get authenticated Gmail service"""
+# API name -> version, for the services the tools use
+_SERVICE_VERSIONS = {
+    "gmail": "v1",
+    "sheets": "v4",
+    "docs": "v1",
+    "drive": "v3",
+    "slides": "v1",
+}
+
+# Each worker thread keeps its own authorized HTTP client: httplib2.Http is not
+# thread-safe, but a per-thread one keeps its TLS connections open for reuse
+_thread_local = threading.local()
+
+
+def _thread_http(credentials):
+    """Get this thread's authorized HTTP client for credentials"""
+    http = getattr(_thread_local, "http", None)
+    if http is None or http.credentials is not credentials:
+        import google_auth_httplib2
+        import httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
+
+
+async def _execute(request) -> dict[str, Any]:
+    """
+    Execute a googleapiclient request in a worker thread
+
+    The client library does blocking HTTP, so calling .execute() directly
+    would stall the event loop (and every other tool call) until Google replied.
+    """
+    credentials = request.http.credentials
+    return await asyncio.to_thread(lambda: request.execute(http=_thread_http(credentials)))
+
+
+@functools.lru_cache(maxsize=len(_SERVICE_VERSIONS))
+def _build_service(name: str, version: str, credentials):
+    """
+    Build an API client once per credentials object
+
+    Credentials are refreshed in place, so the client stays valid until the
+    user re-authenticates. The discovery document ships with the client
+    library, so the on-disk discovery cache is skipped.
+    """
     import googleapiclient.discovery as discovery
 
-    credentials = get_auth_instance().get_credentials()
-    return discovery.build("gmail", "v1", credentials=credentials)
+    return discovery.build(name, version, credentials=credentials, cache_discovery=False)
+
+
+async def _get_service(name: str):
+    """Get an authenticated client for one of _SERVICE_VERSIONS"""
+    credentials = await get_auth_instance().get_credentials()
+    return await asyncio.to_thread(_build_service, name, _SERVICE_VERSIONS[name], credentials)
+
+
+async def get_gmail_service():
+    """Get authenticated Gmail service"""
+    return await _get_service("gmail")
 
 
 async def get_sheets_service():
     """Get authenticated Sheets service"""
-    import googleapiclient.discovery as discovery
-
-    credentials = get_auth_instance().get_credentials()
-    return discovery.build("sheets", "v4", credentials=credentials)
+    return await _get_service("sheets")
 
 
 async def get_docs_service():
     """Get authenticated Docs service"""
-    import googleapiclient.discovery as discovery
-
-    credentials = get_auth_instance().get_credentials()
-    return discovery.build("docs", "v1", credentials=credentials)
+    return await _get_service("docs")
 
 
 async def get_drive_service():
     """Get authenticated Drive service"""
-    import googleapiclient.discovery as discovery
-
-    credentials = get_auth_instance().get_credentials()
-    return discovery.build("drive", "v3", credentials=credentials)
+    return await _get_service("drive")
 
 
 async def get_slides_service():
     """Get authenticated Slides service"""
-    import googleapiclient.discovery as discovery
+    return await _get_service("slides")
+
 
-    credentials = get_auth_instance().get_credentials()
-    return discovery.build("slides", "v1", credentials=credentials)
+async def preload_services() -> None:
+    """
+    Build every API client ahead of the first tool call, then keep the token
+    refreshed in the background so no tool call waits on the token endpoint
+
+    Only the saved token is used, refreshed without the browser OAuth flow
+    (which prints to stdout, the MCP stream); without a usable token this
+    does nothing and authentication happens on the first tool call.
+    """
+    auth = get_auth_instance()
+    try:
+        credentials = await auth.load_saved_credentials()
+    except Exception as e:
+        logger.warning("Could not refresh the saved Google token: %s", e)
+        return
+    if credentials is None:
+        logger.info("No usable saved Google token; skipping client preload")
+        return
+    try:
+        await asyncio.gather(*(
+            asyncio.to_thread(_build_service, name, version, credentials)
+            for name, version in _SERVICE_VERSIONS.items()
+        ))
+    except Exception as e:
+        logger.warning("Could not preload Google API clients: %s", e)
+        return
+    auth.start_proactive_refresh()
 
 
 # =============================================
 # RESOURCES
 # =============================================
 
-@server.list_resources()
-async def handle_list_resources() -> list:
-    """List available resources"""
-    return [
-        {
-            "uri": "workspace://info",
-            "name": "Workspace Information",
-            "description": "General information about the Google Workspace MCP server",
-            "mimeType": "text/plain",
-        },
-        {
-            "uri": "workspace://stats",
-            "name": "Usage Statistics",
-            "description": "Server usage statistics and status",
-            "mimeType": "application/json",
-        },
-    ]
-
-
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
-    """Read a resource"""
-    if uri == "workspace://info":
-        return """Google Workspace MCP Server v0.1.0 (OAuth Edition)
+# workspace://info contents
+WORKSPACE_INFO = """Google Workspace MCP Server v0.1.0 (OAuth Edition)
 
 This server provides tools for interacting with Google Workspace services:
 - Gmail: Send, read, search emails
@@ -122,18 +172,48 @@ Requirements:
 Authentication uses OAuth 2.0 - you'll be prompted to authenticate in your browser
 on first use.
 """
+
+# workspace://stats, encoded once; only the timestamp changes per read
+_STATS_TEMPLATE = orjson.dumps(
+    {
+        "server_version": "0.1.0",
+        "auth_type": "OAuth 2.0",
+        "timestamp": "%s",
+        "services": list(_SERVICE_VERSIONS),
+        "transport": "stdio",
+    },
+    option=orjson.OPT_INDENT_2,
+).decode()
+
+_RESOURCES = (
+    {
+        "uri": "workspace://info",
+        "name": "Workspace Information",
+        "description": "General information about the Google Workspace MCP server",
+        "mimeType": "text/plain",
+    },
+    {
+        "uri": "workspace://stats",
+        "name": "Usage Statistics",
+        "description": "Server usage statistics and status",
+        "mimeType": "application/json",
+    },
+)
+
+
+@server.list_resources()
+async def handle_list_resources() -> list:
+    """List available resources"""
+    return list(_RESOURCES)
+
+
+@server.read_resource()
+async def handle_read_resource(uri: str) -> str:
+    """Read a resource"""
+    if uri == "workspace://info":
+        return WORKSPACE_INFO
     elif uri == "workspace://stats":
-        import json
-        from datetime import datetime
-
-        stats = {
-            "server_version": "0.1.0",
-            "auth_type": "OAuth 2.0",
-            "timestamp": datetime.utcnow().isoformat(),
-            "services": ["gmail", "sheets", "docs", "drive", "slides"],
-            "transport": "stdio",
-        }
-        return json.dumps(stats, indent=2)
+        return _STATS_TEMPLATE % datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
     else:
         raise ValueError(f"Unknown resource: {uri}")
 
@@ -142,283 +222,293 @@ on first use.
 # TOOLS
 # =============================================
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        # GMAIL TOOLS
-        Tool(
-            name="gmail_list_emails",
-            description="List recent emails from Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of emails to return (default: 10)",
-                        "default": 10,
-                    }
-                },
+# Built once at import; tools/list just hands back this tuple
+_TOOLS: tuple[Tool, ...] = (
+    # GMAIL TOOLS
+    Tool(
+        name="gmail_list_emails",
+        description="List recent emails from Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails to return (default: 10)",
+                    "default": 10,
+                }
             },
-        ),
-        Tool(
-            name="gmail_send_email",
-            description="Send an email via Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to": {
-                        "type": "string",
-                        "description": "Recipient email address",
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Email subject",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Email body (plain text)",
-                    },
+        },
+    ),
+    Tool(
+        name="gmail_send_email",
+        description="Send an email via Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address",
+                },
+                "subject": {
+                    "type": "string",
+                    "description": "Email subject",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Email body (plain text)",
                 },
-                "required": ["to", "subject", "body"],
             },
-        ),
-        Tool(
-            name="gmail_search_emails",
-            description="Search for emails in Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (Gmail search syntax)",
-                    },
+            "required": ["to", "subject", "body"],
+        },
+    ),
+    Tool(
+        name="gmail_search_emails",
+        description="Search for emails in Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (Gmail search syntax)",
                 },
-                "required": ["query"],
             },
-        ),
-        Tool(
-            name="gmail_read_email",
-            description="Read a full email by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "Gmail message ID",
-                    },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="gmail_read_email",
+        description="Read a full email by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {
+                    "type": "string",
+                    "description": "Gmail message ID",
                 },
-                "required": ["message_id"],
             },
-        ),
-        # SHEETS TOOLS
-        Tool(
-            name="sheets_create",
-            description="Create a new Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Spreadsheet title",
-                    },
-                    "data": {
+            "required": ["message_id"],
+        },
+    ),
+    # SHEETS TOOLS
+    Tool(
+        name="sheets_create",
+        description="Create a new Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Spreadsheet title",
+                },
+                "data": {
+                    "type": "array",
+                    "description": "Initial data as 2D array",
+                    "items": {
                         "type": "array",
-                        "description": "Initial data as 2D array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
+                        "items": {"type": "string"},
                     },
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="sheets_read",
-            description="Read data from a Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {
-                        "type": "string",
-                        "description": "Spreadsheet ID",
-                    },
-                    "range": {
-                        "type": "string",
-                        "description": "Cell range (e.g., 'Sheet1!A1:D10')",
-                        "default": "Sheet1!A1",
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="sheets_read",
+        description="Read data from a Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {
+                    "type": "string",
+                    "description": "Spreadsheet ID",
+                },
+                "range": {
+                    "type": "string",
+                    "description": "Cell range (e.g., 'Sheet1!A1:D10')",
+                    "default": "Sheet1!A1",
                 },
-                "required": ["spreadsheet_id"],
             },
-        ),
-        Tool(
-            name="sheets_write",
-            description="Write data to a Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {
-                        "type": "string",
-                        "description": "Spreadsheet ID",
-                    },
-                    "range": {
-                        "type": "string",
-                        "description": "Cell range (e.g., 'Sheet1!A1:D10')",
-                    },
-                    "values": {
+            "required": ["spreadsheet_id"],
+        },
+    ),
+    Tool(
+        name="sheets_write",
+        description="Write data to a Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {
+                    "type": "string",
+                    "description": "Spreadsheet ID",
+                },
+                "range": {
+                    "type": "string",
+                    "description": "Cell range (e.g., 'Sheet1!A1:D10')",
+                },
+                "values": {
+                    "type": "array",
+                    "description": "Data to write as 2D array",
+                    "items": {
                         "type": "array",
-                        "description": "Data to write as 2D array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
+                        "items": {"type": "string"},
                     },
                 },
-                "required": ["spreadsheet_id", "range", "values"],
             },
-        ),
-        Tool(
-            name="sheets_append",
-            description="Append rows to a Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {
-                        "type": "string",
-                        "description": "Spreadsheet ID",
-                    },
-                    "range": {
-                        "type": "string",
-                        "description": "Range to append to (e.g., 'Sheet1!A1')",
-                    },
-                    "values": {
+            "required": ["spreadsheet_id", "range", "values"],
+        },
+    ),
+    Tool(
+        name="sheets_append",
+        description="Append rows to a Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {
+                    "type": "string",
+                    "description": "Spreadsheet ID",
+                },
+                "range": {
+                    "type": "string",
+                    "description": "Range to append to (e.g., 'Sheet1!A1')",
+                },
+                "values": {
+                    "type": "array",
+                    "description": "Rows to append as 2D array",
+                    "items": {
                         "type": "array",
-                        "description": "Rows to append as 2D array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
+                        "items": {"type": "string"},
                     },
                 },
-                "required": ["spreadsheet_id", "values"],
             },
-        ),
-        # DOCS TOOLS
-        Tool(
-            name="docs_create",
-            description="Create a new Google Docs document",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Document title",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Document content",
-                    },
+            "required": ["spreadsheet_id", "values"],
+        },
+    ),
+    # DOCS TOOLS
+    Tool(
+        name="docs_create",
+        description="Create a new Google Docs document",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Document title",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Document content",
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="docs_read",
-            description="Read a Google Docs document",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {
-                        "type": "string",
-                        "description": "Document ID",
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="docs_read",
+        description="Read a Google Docs document",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {
+                    "type": "string",
+                    "description": "Document ID",
                 },
-                "required": ["document_id"],
             },
-        ),
-        # DRIVE TOOLS
-        Tool(
-            name="drive_list_files",
-            description="List files in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20,
-                    },
+            "required": ["document_id"],
+        },
+    ),
+    # DRIVE TOOLS
+    Tool(
+        name="drive_list_files",
+        description="List files in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20,
                 },
             },
-        ),
-        Tool(
-            name="drive_create_file",
-            description="Create a file in Google Drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "File name",
-                    },
-                    "mime_type": {
-                        "type": "string",
-                        "description": "MIME type (e.g., 'application/vnd.google-apps.document')",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "File content (for docs)",
-                    },
+        },
+    ),
+    Tool(
+        name="drive_create_file",
+        description="Create a file in Google Drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "File name",
+                },
+                "mime_type": {
+                    "type": "string",
+                    "description": "MIME type (e.g., 'application/vnd.google-apps.document')",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "File content (for docs)",
                 },
-                "required": ["name", "mime_type"],
             },
-        ),
-        Tool(
-            name="drive_share_file",
-            description="Share a file with another user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {
-                        "type": "string",
-                        "description": "File ID to share",
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Email address to share with",
-                    },
-                    "role": {
-                        "type": "string",
-                        "description": "Permission role (reader, writer, owner)",
-                        "enum": ["reader", "writer", "owner"],
-                        "default": "reader",
-                    },
+            "required": ["name", "mime_type"],
+        },
+    ),
+    Tool(
+        name="drive_share_file",
+        description="Share a file with another user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {
+                    "type": "string",
+                    "description": "File ID to share",
+                },
+                "email": {
+                    "type": "string",
+                    "description": "Email address to share with",
+                },
+                "role": {
+                    "type": "string",
+                    "description": "Permission role (reader, writer, owner)",
+                    "enum": ["reader", "writer", "owner"],
+                    "default": "reader",
                 },
-                "required": ["file_id", "email"],
             },
-        ),
-        # SLIDES TOOLS
-        Tool(
-            name="slides_create",
-            description="Create a new Google Slides presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Presentation title",
-                    },
+            "required": ["file_id", "email"],
+        },
+    ),
+    # SLIDES TOOLS
+    Tool(
+        name="slides_create",
+        description="Create a new Google Slides presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Presentation title",
                 },
-                "required": ["title"],
             },
-        ),
-    ]
+            "required": ["title"],
+        },
+    ),
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools"""
+    return list(_TOOLS)
+
+
+# Fixed responses, built once and shared (responses are never mutated)
+_EMAIL_SENT = TextContent(type="text", text="Email sent successfully")
+_DATA_WRITTEN = TextContent(type="text", text="Data written successfully")
+_ROWS_APPENDED = TextContent(type="text", text="Rows appended successfully")
 
 
 @server.call_tool()
@@ -428,10 +518,10 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
         # GMAIL
         if name == "gmail_list_emails":
             service = await get_gmail_service()
-            results = service.users().messages().list(
+            results = await _execute(service.users().messages().list(
                 userId="me",
                 maxResults=arguments.get("max_results", 10)
-            ).execute()
+            ))
             messages = results.get("messages", [])
             return [TextContent(
                 type="text",
@@ -449,18 +539,18 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
             message["Subject"] = arguments["subject"]
 
             encoded = base64.urlsafe_b64encode(message.as_bytes()).decode()
-            service.users().messages().send(
+            await _execute(service.users().messages().send(
                 userId="me",
                 body={"raw": encoded}
-            ).execute()
-            return [TextContent(type="text", text="Email sent successfully")]
+            ))
+            return [_EMAIL_SENT]
 
         elif name == "gmail_search_emails":
             service = await get_gmail_service()
-            results = service.users().messages().list(
+            results = await _execute(service.users().messages().list(
                 userId="me",
                 q=arguments["query"]
-            ).execute()
+            ))
             messages = results.get("messages", [])
             return [TextContent(
                 type="text",
@@ -469,11 +559,11 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 
         elif name == "gmail_read_email":
             service = await get_gmail_service()
-            msg = service.users().messages().get(
+            msg = await _execute(service.users().messages().get(
                 userId="me",
                 id=arguments["message_id"],
                 format="full"
-            ).execute()
+            ))
             return [TextContent(
                 type="text",
                 text=f"Email data: {msg.get('snippet', 'No snippet available')}"
@@ -497,7 +587,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
             else:
                 body = {"properties": {"title": arguments["title"]}}
 
-            spreadsheet = service.spreadsheets().create(body=body).execute()
+            spreadsheet = await _execute(service.spreadsheets().create(body=body))
             return [TextContent(
                 type="text",
                 text=f"Created spreadsheet: {spreadsheet['spreadsheetUrl']}\nID: {spreadsheet['spreadsheetId']}"
@@ -505,10 +595,10 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 
         elif name == "sheets_read":
             service = await get_sheets_service()
-            result = service.spreadsheets().values().get(
+            result = await _execute(service.spreadsheets().values().get(
                 spreadsheetId=arguments["spreadsheet_id"],
                 range=arguments.get("range", "Sheet1!A1")
-            ).execute()
+            ))
             values = result.get("values", [])
             return [TextContent(
                 type="text",
@@ -518,24 +608,24 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
         elif name == "sheets_write":
             service = await get_sheets_service()
             body = {"values": arguments["values"]}
-            service.spreadsheets().values().update(
+            await _execute(service.spreadsheets().values().update(
                 spreadsheetId=arguments["spreadsheet_id"],
                 range=arguments["range"],
                 valueInputOption="RAW",
                 body=body
-            ).execute()
-            return [TextContent(type="text", text="Data written successfully")]
+            ))
+            return [_DATA_WRITTEN]
 
         elif name == "sheets_append":
             service = await get_sheets_service()
             body = {"values": arguments["values"]}
-            service.spreadsheets().values().append(
+            await _execute(service.spreadsheets().values().append(
                 spreadsheetId=arguments["spreadsheet_id"],
                 range=arguments.get("range", "Sheet1!A1"),
                 valueInputOption="RAW",
                 body=body
-            ).execute()
-            return [TextContent(type="text", text="Rows appended successfully")]
+            ))
+            return [_ROWS_APPENDED]
 
         # DOCS
         elif name == "docs_create":
@@ -553,7 +643,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
                         }
                     }]
                 }
-            doc = service.documents().create(body=body).execute()
+            doc = await _execute(service.documents().create(body=body))
             return [TextContent(
                 type="text",
                 text=f"Created document: https://docs.google.com/document/d/{doc['documentId']}/edit"
@@ -561,9 +651,9 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 
         elif name == "docs_read":
             service = await get_docs_service()
-            doc = service.documents().get(
+            doc = await _execute(service.documents().get(
                 documentId=arguments["document_id"]
-            ).execute()
+            ))
             content = doc.get("body", {}).get("content", [])
             text = "".join([
                 elem.get("paragraph", {}).get("elements", [{}])[0].get("textRun", {}).get("content", "")
@@ -574,11 +664,11 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
         # DRIVE
         elif name == "drive_list_files":
             service = await get_drive_service()
-            results = service.files().list(
+            results = await _execute(service.files().list(
                 q=arguments.get("query", ""),
                 pageSize=arguments.get("max_results", 20),
                 fields="files(id,name,mimeType)"
-            ).execute()
+            ))
             files = results.get("files", [])
             output = "\n".join([f"{f['name']} ({f['mimeType']}) - ID: {f['id']}" for f in files])
             return [TextContent(type="text", text=output or "No files found")]
@@ -589,7 +679,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
                 "name": arguments["name"],
                 "mimeType": arguments["mime_type"]
             }
-            file = service.files().create(body=body, fields="id,name,webViewLink").execute()
+            file = await _execute(service.files().create(body=body, fields="id,name,webViewLink"))
             return [TextContent(
                 type="text",
                 text=f"Created file: {file['webViewLink']}\nID: {file['id']}"
@@ -602,11 +692,11 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
                 "type": "user",
                 "emailAddress": arguments["email"]
             }
-            service.permissions().create(
+            await _execute(service.permissions().create(
                 fileId=arguments["file_id"],
                 body=body,
                 sendNotificationEmail=False
-            ).execute()
+            ))
             return [TextContent(
                 type="text",
                 text=f"File shared with {arguments['email']} as {arguments.get('role', 'reader')}"
@@ -618,7 +708,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
             body = {
                 "title": arguments["title"]
             }
-            presentation = service.presentations().create(body=body).execute()
+            presentation = await _execute(service.presentations().create(body=body))
             return [TextContent(
                 type="text",
                 text=f"Created presentation: https://docs.google.com/presentation/d/{presentation['presentationId']}/edit"
@@ -638,6 +728,10 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
 # MAIN ENTRY POINT
 # =============================================
 
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+
 async def main():
     """Main entry point for the MCP server"""
     # Verify environment variables are set
@@ -652,6 +746,11 @@ async def main():
             "Please run ./install.sh to set up OAuth credentials."
         )
 
+    # Warm the API clients and start token refresh while the client connects
+    task = asyncio.create_task(preload_services())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
     # Run the server
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
@@ -8,101 +8,111 @@ using gogcli as the backend.
 Services: Gmail, Sheets, Docs, Slides, Calendar
 """
 
+import argparse
 import asyncio
-import json
+import importlib.util
+import logging
 import os
-import subprocess
-from typing import Any
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from google_workspace_mcp.gogcli_bin import gogcli_executable
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on gogcli processes running at once (see gogcli_server)
+GOGCLI_MAX_CONCURRENCY = int(os.getenv("GOGCLI_MAX_CONCURRENCY", "16"))
+_GOGCLI_SEM = asyncio.Semaphore(GOGCLI_MAX_CONCURRENCY)
+
 # Configuration
 DEFAULT_PORT = 9001
-GOGCLI_BIN = os.getenv("GOGCLI_BIN", "gogcli")
 DEFAULT_ACCOUNT = os.getenv("GOGCLI_ACCOUNT", "")
 
 
-def run_gogcli(args: list[str], account: str | None = None, timeout: int = 60) -> dict[str, Any]:
-    """Run a gogcli command and return the result"""
+async def run_gogcli(args: list[str], account: str | None = None, timeout: int = 60) -> dict[str, Any]:
+    """Run a gogcli command as an asyncio subprocess and return the result"""
     acc = account or DEFAULT_ACCOUNT
-    cmd = [GOGCLI_BIN] + args
+    cmd = [gogcli_executable()] + args
 
     if acc:
         cmd.extend(["--account", acc])
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+    async with _GOGCLI_SEM:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                # Never inherit our stdin: it carries the MCP stdio stream
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Keeps CPython on its posix_spawn fast path (which also needs an
+                # executable path with a directory and no preexec_fn/cwd); our own
+                # fds are non-inheritable anyway (PEP 446)
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            return {
+                "success": False,
+                "error": f"gogcli not found. Install from https://github.com/steipete/gogcli/releases"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {
+                "success": False,
+                "error": f"Command timed out after {timeout} seconds"
+            }
+
+        # Decode each buffer once (skipping empty ones, e.g. stderr on success);
+        # a stray invalid byte shouldn't turn into an error
+        output = stdout.decode("utf-8", errors="replace").strip() if stdout else ""
+        errors = stderr.decode("utf-8", errors="replace").strip() if stderr else ""
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             return {
                 "success": True,
-                "output": result.stdout.strip(),
-                "stderr": result.stderr.strip()
+                "output": output,
+                "stderr": errors
             }
         else:
             return {
                 "success": False,
-                "error": result.stderr.strip() or result.stdout.strip(),
-                "returncode": result.returncode
+                "error": errors or output,
+                "returncode": proc.returncode
             }
 
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "error": f"Command timed out after {timeout} seconds"
-        }
-    except FileNotFoundError:
-        return {
-            "success": False,
-            "error": f"gogcli not found. Install from https://github.com/steipete/gogcli/releases"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
 
-# Create server instance
-server = Server("google-workspace-gogcli-server")
+# gogcli --version output; the binary doesn't change under a running server
+_VERSION_CACHE: str | None = None
 
 
-# =============================================
-# RESOURCES
-# =============================================
+async def get_gogcli_version() -> dict[str, Any]:
+    """Return gogcli's version, running `gogcli --version` only until it succeeds"""
+    global _VERSION_CACHE
+    if _VERSION_CACHE is not None:
+        return {"success": True, "output": _VERSION_CACHE}
 
-@server.list_resources()
-async def handle_list_resources() -> list:
-    """List available resources"""
-    return [
-        {
-            "uri": "workspace://info",
-            "name": "Workspace Information",
-            "description": "Information about the Google Workspace MCP server (gogcli backend)",
-            "mimeType": "text/plain",
-        },
-        {
-            "uri": "workspace://gogcli-version",
-            "name": "gogcli Version",
-            "description": "gogcli version information",
-            "mimeType": "text/plain",
-        },
-    ]
+    result = await run_gogcli(["--version"], timeout=10)
+    if result["success"]:
+        _VERSION_CACHE = result["output"]
+    return result
 
 
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
-    """Read a resource"""
-    if uri == "workspace://info":
-        return """Google Workspace MCP Server v0.2.0 (gogcli Edition)
+# workspace://info contents
+WORKSPACE_INFO = """Google Workspace MCP Server v0.2.0 (gogcli Edition)
 
 This server provides tools for interacting with Google Workspace services:
 - Gmail: Send, read, search emails with HTML support
@@ -123,8 +133,51 @@ Tools Available (27 total):
 
 Run ./install.sh --server-only to start the server on port 9001.
 """
+
+
+# Create server instance
+server = Server("google-workspace-gogcli-server")
+
+
+# =============================================
+# RESOURCES
+# =============================================
+
+_RESOURCES = (
+    {
+        "uri": "workspace://info",
+        "name": "Workspace Information",
+        "description": "Information about the Google Workspace MCP server (gogcli backend)",
+        "mimeType": "text/plain",
+    },
+    {
+        "uri": "workspace://gogcli-version",
+        "name": "gogcli Version",
+        "description": "gogcli version information",
+        "mimeType": "text/plain",
+    },
+)
+
+# Resources whose contents never change
+_RESOURCE_TABLE = {
+    "workspace://info": WORKSPACE_INFO,
+}
+
+
+@server.list_resources()
+async def handle_list_resources() -> list:
+    """List available resources"""
+    return list(_RESOURCES)
+
+
+@server.read_resource()
+async def handle_read_resource(uri: str) -> str:
+    """Read a resource"""
+    text = _RESOURCE_TABLE.get(uri)
+    if text is not None:
+        return text
     elif uri == "workspace://gogcli-version":
-        result = run_gogcli(["--version"])
+        result = await get_gogcli_version()
         if result["success"]:
             return result["output"]
         else:
@@ -137,340 +190,378 @@ Run ./install.sh --server-only to start the server on port 9001.
 # TOOLS
 # =============================================
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        # GMAIL TOOLS
-        Tool(
-            name="gmail_send_email",
-            description="Send an email via Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to": {"type": "string", "description": "Recipient email(s), comma-separated"},
-                    "subject": {"type": "string", "description": "Email subject"},
-                    "body": {"type": "string", "description": "Email body (plain text or HTML file path)"},
-                    "body_file": {"type": "string", "description": "Path to HTML file for email body"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["to", "subject"],
+# Built once at import; tools/list just hands back this tuple
+_TOOLS: tuple[Tool, ...] = (
+    # GMAIL TOOLS
+    Tool(
+        name="gmail_send_email",
+        description="Send an email via Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {"type": "string", "description": "Recipient email(s), comma-separated"},
+                "subject": {"type": "string", "description": "Email subject"},
+                "body": {"type": "string", "description": "Email body (plain text or HTML file path)"},
+                "body_file": {"type": "string", "description": "Path to HTML file for email body"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="gmail_search_emails",
-            description="Search for emails in Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Gmail search query"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["query"],
+            "required": ["to", "subject"],
+        },
+    ),
+    Tool(
+        name="gmail_search_emails",
+        description="Search for emails in Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Gmail search query"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="gmail_read_email",
-            description="Read a full email by message ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {"type": "string", "description": "Gmail message ID"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["message_id"],
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="gmail_read_email",
+        description="Read a full email by message ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {"type": "string", "description": "Gmail message ID"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="gmail_list_labels",
-            description="List Gmail labels",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
+            "required": ["message_id"],
+        },
+    ),
+    Tool(
+        name="gmail_list_labels",
+        description="List Gmail labels",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-
-        # SHEETS TOOLS
-        Tool(
-            name="sheets_create",
-            description="Create a new Google Sheets spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Spreadsheet title"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["title"],
+        },
+    ),
+
+    # SHEETS TOOLS
+    Tool(
+        name="sheets_create",
+        description="Create a new Google Sheets spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Spreadsheet title"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="sheets_read",
-            description="Read data from a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
-                    "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["spreadsheet_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="sheets_read",
+        description="Read data from a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
+                "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="sheets_write",
-            description="Write data to a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
-                    "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
-                    "data": {"type": "string", "description": "Data to write"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["spreadsheet_id", "range", "data"],
+            "required": ["spreadsheet_id"],
+        },
+    ),
+    Tool(
+        name="sheets_write",
+        description="Write data to a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
+                "range": {"type": "string", "description": "Cell range (e.g., Sheet1!A1:D10)"},
+                "data": {"type": "string", "description": "Data to write"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="sheets_append",
-            description="Append rows to a spreadsheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
-                    "range": {"type": "string", "description": "Range to append to"},
-                    "data": {"type": "string", "description": "Data to append"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["spreadsheet_id", "data"],
+            "required": ["spreadsheet_id", "range", "data"],
+        },
+    ),
+    Tool(
+        name="sheets_append",
+        description="Append rows to a spreadsheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string", "description": "Spreadsheet ID"},
+                "range": {"type": "string", "description": "Range to append to"},
+                "data": {"type": "string", "description": "Data to append"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-
-        # DOCS TOOLS
-        Tool(
-            name="docs_create",
-            description="Create a new Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Document title"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["title"],
+            "required": ["spreadsheet_id", "data"],
+        },
+    ),
+
+    # DOCS TOOLS
+    Tool(
+        name="docs_create",
+        description="Create a new Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Document title"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="docs_read",
-            description="Read a Google Doc as plain text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {"type": "string", "description": "Document ID"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["doc_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="docs_read",
+        description="Read a Google Doc as plain text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {"type": "string", "description": "Document ID"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="docs_export",
-            description="Export a Google Doc",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {"type": "string", "description": "Document ID"},
-                    "format": {"type": "string", "description": "Export format (pdf, docx, txt)", "enum": ["pdf", "docx", "txt"]},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["doc_id"],
+            "required": ["doc_id"],
+        },
+    ),
+    Tool(
+        name="docs_export",
+        description="Export a Google Doc",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {"type": "string", "description": "Document ID"},
+                "format": {"type": "string", "description": "Export format (pdf, docx, txt)", "enum": ["pdf", "docx", "txt"]},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-
-        # SLIDES TOOLS
-        Tool(
-            name="slides_create",
-            description="Create a new Google Slides presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Presentation title"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["title"],
+            "required": ["doc_id"],
+        },
+    ),
+
+    # SLIDES TOOLS
+    Tool(
+        name="slides_create",
+        description="Create a new Google Slides presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Presentation title"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="slides_info",
-            description="Get presentation metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["presentation_id"],
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="slides_info",
+        description="Get presentation metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": {"type": "string", "description": "Presentation ID"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-
-        # CALENDAR TOOLS
-        Tool(
-            name="calendar_list_events",
-            description="List calendar events",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {"type": "string", "description": "Calendar ID (primary for default)"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
+            "required": ["presentation_id"],
+        },
+    ),
+
+    # CALENDAR TOOLS
+    Tool(
+        name="calendar_list_events",
+        description="List calendar events",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {"type": "string", "description": "Calendar ID (primary for default)"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="calendar_create_event",
-            description="Create a new calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {"type": "string", "description": "Calendar ID (primary for default)"},
-                    "summary": {"type": "string", "description": "Event title"},
-                    "description": {"type": "string", "description": "Event description"},
-                    "location": {"type": "string", "description": "Event location"},
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
-                "required": ["calendar_id", "summary"],
+        },
+    ),
+    Tool(
+        name="calendar_create_event",
+        description="Create a new calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {"type": "string", "description": "Calendar ID (primary for default)"},
+                "summary": {"type": "string", "description": "Event title"},
+                "description": {"type": "string", "description": "Event description"},
+                "location": {"type": "string", "description": "Event location"},
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-        Tool(
-            name="calendar_list_calendars",
-            description="List all calendars",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "account": {"type": "string", "description": "Google account to use"},
-                },
+            "required": ["calendar_id", "summary"],
+        },
+    ),
+    Tool(
+        name="calendar_list_calendars",
+        description="List all calendars",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "account": {"type": "string", "description": "Google account to use"},
             },
-        ),
-    ]
+        },
+    ),
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools"""
+    return list(_TOOLS)
+
+
+def _reply(result: dict[str, Any]) -> list[TextContent]:
+    """Wrap a run_gogcli result as tool output: its stdout, or its error"""
+    text = result.get("output", "") if result["success"] else result.get("error", "")
+    return [TextContent(type="text", text=text)]
+
+
+# GMAIL TOOLS
+
+async def _gmail_send_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    to = arguments["to"]
+    subject = arguments["subject"]
+    body = arguments.get("body", "")
+    body_file = arguments.get("body_file", "")
+
+    args_list = ["send", "--to", to, "--subject", subject]
+
+    if body_file:
+        args_list.extend(["--body-file", body_file])
+    elif body:
+        args_list.extend(["--body", body])
+
+    return _reply(await run_gogcli(["gmail"] + args_list, account))
+
+
+async def _gmail_search_emails(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    query = arguments["query"]
+    return _reply(await run_gogcli(["gmail", "search", query], account))
+
+
+async def _gmail_read_email(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    msg_id = arguments["message_id"]
+    return _reply(await run_gogcli(["gmail", "get", msg_id], account))
+
+
+async def _gmail_list_labels(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    return _reply(await run_gogcli(["gmail", "labels"], account))
+
+
+# SHEETS TOOLS
+
+async def _sheets_create(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    title = arguments["title"]
+    return _reply(await run_gogcli(["sheets", "create", title], account))
+
+
+async def _sheets_read(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    sheet_id = arguments["spreadsheet_id"]
+    range_val = arguments.get("range", "A1")
+    return _reply(await run_gogcli(["sheets", "get", sheet_id, range_val], account))
+
+
+async def _sheets_write(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    sheet_id = arguments["spreadsheet_id"]
+    range_val = arguments["range"]
+    data = arguments["data"]
+    return _reply(await run_gogcli(["sheets", "update", sheet_id, range_val, data], account))
+
+
+async def _sheets_append(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    sheet_id = arguments["spreadsheet_id"]
+    range_val = arguments.get("range", "A1")
+    data = arguments["data"]
+    return _reply(await run_gogcli(["sheets", "append", sheet_id, range_val, data], account))
+
+
+# DOCS TOOLS
+
+async def _docs_create(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    title = arguments["title"]
+    return _reply(await run_gogcli(["docs", "create", title], account))
+
+
+async def _docs_read(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    doc_id = arguments["doc_id"]
+    return _reply(await run_gogcli(["docs", "cat", doc_id], account))
+
+
+async def _docs_export(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    doc_id = arguments["doc_id"]
+    fmt = arguments.get("format", "pdf")
+    return _reply(await run_gogcli(["docs", "export", doc_id, f"--{fmt}"], account))
+
+
+# SLIDES TOOLS
+
+async def _slides_create(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    title = arguments["title"]
+    return _reply(await run_gogcli(["slides", "create", title], account))
+
+
+async def _slides_info(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    pres_id = arguments["presentation_id"]
+    return _reply(await run_gogcli(["slides", "info", pres_id], account))
+
+
+# CALENDAR TOOLS
+
+async def _calendar_list_events(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    cal_id = arguments.get("calendar_id", "primary")
+    return _reply(await run_gogcli(["calendar", "events", cal_id], account))
+
+
+async def _calendar_create_event(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    cal_id = arguments["calendar_id"]
+    summary = arguments["summary"]
+    description = arguments.get("description", "")
+    location = arguments.get("location", "")
+
+    args_list = ["calendar", "create", cal_id, summary]
+    if description:
+        args_list.extend(["--description", description])
+    if location:
+        args_list.extend(["--location", location])
+
+    return _reply(await run_gogcli(args_list, account))
+
+
+async def _calendar_list_calendars(arguments: dict[str, Any], account: str | None) -> list[TextContent]:
+    return _reply(await run_gogcli(["calendar", "calendars"], account))
+
+
+ToolHandler = Callable[[dict[str, Any], str | None], Awaitable[list[TextContent]]]
+
+# Tool name -> handler; handle_call_tool does a single dict lookup
+_HANDLERS: dict[str, ToolHandler] = {
+    "gmail_send_email": _gmail_send_email,
+    "gmail_search_emails": _gmail_search_emails,
+    "gmail_read_email": _gmail_read_email,
+    "gmail_list_labels": _gmail_list_labels,
+    "sheets_create": _sheets_create,
+    "sheets_read": _sheets_read,
+    "sheets_write": _sheets_write,
+    "sheets_append": _sheets_append,
+    "docs_create": _docs_create,
+    "docs_read": _docs_read,
+    "docs_export": _docs_export,
+    "slides_create": _slides_create,
+    "slides_info": _slides_info,
+    "calendar_list_events": _calendar_list_events,
+    "calendar_create_event": _calendar_create_event,
+    "calendar_list_calendars": _calendar_list_calendars,
+}
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls"""
-    account = arguments.get("account", None)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
     try:
-        # GMAIL TOOLS
-        if name == "gmail_send_email":
-            to = arguments["to"]
-            subject = arguments["subject"]
-            body = arguments.get("body", "")
-            body_file = arguments.get("body_file", "")
-
-            args_list = ["send", "--to", to, "--subject", subject]
-
-            if body_file:
-                args_list.extend(["--body-file", body_file])
-            elif body:
-                args_list.extend(["--body", body])
-
-            result = run_gogcli(["gmail"] + args_list, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_search_emails":
-            query = arguments["query"]
-            result = run_gogcli(["gmail", "search", query], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_read_email":
-            msg_id = arguments["message_id"]
-            result = run_gogcli(["gmail", "get", msg_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "gmail_list_labels":
-            result = run_gogcli(["gmail", "labels"], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # SHEETS TOOLS
-        elif name == "sheets_create":
-            title = arguments["title"]
-            result = run_gogcli(["sheets", "create", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_read":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments.get("range", "A1")
-            result = run_gogcli(["sheets", "get", sheet_id, range_val], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_write":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments["range"]
-            data = arguments["data"]
-            result = run_gogcli(["sheets", "update", sheet_id, range_val, data], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "sheets_append":
-            sheet_id = arguments["spreadsheet_id"]
-            range_val = arguments.get("range", "A1")
-            data = arguments["data"]
-            result = run_gogcli(["sheets", "append", sheet_id, range_val, data], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # DOCS TOOLS
-        elif name == "docs_create":
-            title = arguments["title"]
-            result = run_gogcli(["docs", "create", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "docs_read":
-            doc_id = arguments["doc_id"]
-            result = run_gogcli(["docs", "cat", doc_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "docs_export":
-            doc_id = arguments["doc_id"]
-            fmt = arguments.get("format", "pdf")
-            result = run_gogcli(["docs", "export", doc_id, f"--{fmt}"], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # SLIDES TOOLS
-        elif name == "slides_create":
-            title = arguments["title"]
-            result = run_gogcli(["slides", "create", title], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "slides_info":
-            pres_id = arguments["presentation_id"]
-            result = run_gogcli(["slides", "info", pres_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        # CALENDAR TOOLS
-        elif name == "calendar_list_events":
-            cal_id = arguments.get("calendar_id", "primary")
-            result = run_gogcli(["calendar", "events", cal_id], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "calendar_create_event":
-            cal_id = arguments["calendar_id"]
-            summary = arguments["summary"]
-            description = arguments.get("description", "")
-            location = arguments.get("location", "")
-
-            args_list = ["calendar", "create", cal_id, summary]
-            if description:
-                args_list.extend(["--description", description])
-            if location:
-                args_list.extend(["--location", location])
-
-            result = run_gogcli(args_list, account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        elif name == "calendar_list_calendars":
-            result = run_gogcli(["calendar", "calendars"], account)
-            return [TextContent(type="text", text=result.get("output", result["error"]))]
-
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
+        return await handler(arguments, arguments.get("account", None))
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -497,8 +588,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    import argparse
-
     parser = argparse.ArgumentParser(description="Google Workspace MCP Server (gogcli backend)")
     parser.add_argument("--server-only", action="store_true", help="Run in SSE server mode")
     parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port for SSE server (default: {DEFAULT_PORT})")
@@ -506,12 +595,11 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.server_only:
-        # For SSE mode, use the original gogcli_server.py
-        import importlib
-        import sys
+        # For SSE mode, use the original gogcli_server.py; it is only loaded
+        # here, so stdio mode never builds its tool tables
         spec = importlib.util.spec_from_file_location(
             "google_workspace_mcp.gogcli_server",
-            "google_workspace_mcp/gogcli_server.py"
+            Path(__file__).with_name("gogcli_server.py"),
         )
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
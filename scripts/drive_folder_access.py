@@ -42,10 +42,15 @@ def get_credentials_console():
     """Get OAuth credentials using console-based flow (no browser)"""
 
     # Check if we have saved credentials
-    if TOKEN_FILE.exists():
+    try:
+        with open(TOKEN_FILE, 'r') as f:
+            token_json = f.read()
+    except FileNotFoundError:
+        token_json = None
+
+    if token_json is not None:
         try:
-            with open(TOKEN_FILE, 'r') as f:
-                token_data = json.load(f)
+            token_data = json.loads(token_json)
             creds = Credentials.from_oauth2_info(token_data)
             if creds.expired and creds.refresh_token:
                 print("Refreshing credentials...")
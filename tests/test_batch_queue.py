@@ -0,0 +1,92 @@
+"""
+Tests for the Apps Script client's append_row batching
+"""
+
+import asyncio
+
+import pytest
+
+from google_workspace_mcp.client import _BatchQueue
+
+
+class StubClient:
+    """Records what _BatchQueue sends instead of talking to Apps Script"""
+
+    def __init__(self, fail_batch: bool = False):
+        self.posts = []
+        self.batches = []
+        self.fail_batch = fail_batch
+
+    async def _post(self, payload, lazy=False):
+        self.posts.append(payload)
+        await asyncio.sleep(0.01)
+        return {"success": True, "row": payload["n"]}
+
+    async def _post_batch(self, payloads):
+        self.batches.append(payloads)
+        await asyncio.sleep(0.01)
+        if self.fail_batch:
+            raise ConnectionError("connection reset")
+        return [
+            {"success": False, "error": "bad row"} if payload.get("bad")
+            else {"success": True, "row": payload["n"]}
+            for payload in payloads
+        ]
+
+
+@pytest.mark.asyncio
+async def test_lone_call_is_sent_at_once():
+    client = StubClient()
+    queue = _BatchQueue(client, window=10)
+
+    # A 10 s window would time out if a lone call waited for it
+    result = await asyncio.wait_for(queue.submit({"n": 1}), timeout=1)
+
+    assert result == {"success": True, "row": 1}
+    assert client.posts == [{"n": 1}]
+    assert client.batches == []
+
+
+@pytest.mark.asyncio
+async def test_burst_is_flushed_as_one_batch():
+    client = StubClient()
+    queue = _BatchQueue(client)
+
+    results = await asyncio.gather(*(queue.submit({"n": n}) for n in range(4)))
+
+    # The first call goes out alone; the rest arrive while it is in flight
+    assert [result["row"] for result in results] == [0, 1, 2, 3]
+    assert client.posts == [{"n": 0}]
+    assert client.batches == [[{"n": 1}, {"n": 2}, {"n": 3}]]
+
+
+@pytest.mark.asyncio
+async def test_item_error_reaches_only_its_caller():
+    client = StubClient()
+    queue = _BatchQueue(client)
+
+    results = await asyncio.gather(
+        queue.submit({"n": 0}),
+        queue.submit({"n": 1}),
+        queue.submit({"n": 2, "bad": True}),
+        queue.submit({"n": 3}),
+    )
+
+    assert results[2] == {"success": False, "error": "bad row"}
+    assert all(results[n]["success"] for n in (0, 1, 3))
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_waiting_caller():
+    client = StubClient(fail_batch=True)
+    queue = _BatchQueue(client)
+
+    results = await asyncio.gather(
+        *(queue.submit({"n": n}) for n in range(3)), return_exceptions=True
+    )
+
+    assert results[0] == {"success": True, "row": 0}
+    assert all(isinstance(result, ConnectionError) for result in results[1:])
+    # The queue is usable again: the next lone call goes straight out
+    assert await queue.submit({"n": 9}) == {"success": True, "row": 9}
+    assert client.posts[-1] == {"n": 9}
@@ -0,0 +1,134 @@
+"""
+Tests for the gogcli server's read cache and its write invalidation
+"""
+
+import pytest
+
+import google_workspace_mcp.gogcli_server as gogcli_server
+from google_workspace_mcp.gogcli_server import _IndexedTTLCache
+
+
+class FakeClock:
+    """Timer for a TTLCache that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def gogcli_calls(monkeypatch):
+    """Replace run_gogcli with a recorder, and start from an empty read cache"""
+    calls = []
+
+    async def fake_run_gogcli(service, command, args, account=None, on_line=None, **kwargs):
+        calls.append((service, command, *args))
+        return {"success": True, "output": f"{service} {command} #{len(calls)}"}
+
+    monkeypatch.setattr(gogcli_server, "run_gogcli", fake_run_gogcli)
+    monkeypatch.setattr(gogcli_server, "_read_cache", _IndexedTTLCache(maxsize=64, ttl=30))
+    return calls
+
+
+async def read_sheet(spreadsheet_id: str) -> dict:
+    return await gogcli_server._cached_run(
+        "sheets_read", {"spreadsheet_id": spreadsheet_id}, "sheets", "read", [spreadsheet_id]
+    )
+
+
+async def list_drive() -> dict:
+    return await gogcli_server._cached_run("drive_list_files", {}, "drive", "ls", [])
+
+
+@pytest.mark.asyncio
+async def test_repeat_read_is_served_from_cache(gogcli_calls):
+    first = await read_sheet("S1")
+    second = await read_sheet("S1")
+
+    assert second == first
+    assert len(gogcli_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_no_cache_skips_the_lookup(gogcli_calls):
+    await read_sheet("S1")
+    await gogcli_server._cached_run(
+        "sheets_read", {"spreadsheet_id": "S1", "no_cache": True}, "sheets", "read", ["S1"]
+    )
+
+    assert len(gogcli_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cached_read(gogcli_calls):
+    await read_sheet("S1")
+    await read_sheet("S2")
+
+    gogcli_server._invalidate("sheets_write", {"spreadsheet_id": "S1"})
+    await read_sheet("S1")
+    await read_sheet("S2")
+
+    # S1 was read again; S2, untouched by the write, stayed cached
+    assert gogcli_calls.count(("sheets", "read", "S1")) == 2
+    assert gogcli_calls.count(("sheets", "read", "S2")) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_invalidates_drive_listing(gogcli_calls):
+    await list_drive()
+
+    gogcli_server._invalidate("docs_create", {"title": "New doc"})
+    await list_drive()
+
+    assert gogcli_calls.count(("drive", "ls")) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_read_is_not_cached(monkeypatch, gogcli_calls):
+    async def failing_run_gogcli(service, command, args, account=None, on_line=None, **kwargs):
+        gogcli_calls.append((service, command, *args))
+        return {"success": False, "error": "boom"}
+
+    monkeypatch.setattr(gogcli_server, "run_gogcli", failing_run_gogcli)
+    await read_sheet("S1")
+    await read_sheet("S1")
+
+    assert len(gogcli_calls) == 2
+    assert not gogcli_server._read_cache._index
+
+
+def test_expired_entry_is_unindexed():
+    clock = FakeClock()
+    cache = _IndexedTTLCache(maxsize=8, ttl=30, timer=clock)
+    cache.add("old", 1, "S1")
+
+    clock.now = 31
+    cache.add("new", 2, "S2")  # setting an item purges expired ones
+
+    assert "old" not in cache
+    assert cache._index == {"S2": {"new"}}
+    assert "old" not in cache._resources
+
+
+def test_evicted_entry_is_unindexed():
+    cache = _IndexedTTLCache(maxsize=1, ttl=30)
+    cache.add("first", 1, "S1")
+    cache.add("second", 2, "S2")
+
+    assert cache._index == {"S2": {"second"}}
+
+
+def test_drop_removes_every_key_of_a_resource():
+    clock = FakeClock()
+    cache = _IndexedTTLCache(maxsize=8, ttl=30, timer=clock)
+    cache.add("a", 1, "S1")
+    cache.add("b", 2, "S1")
+    cache.add("c", 3, "S2")
+
+    clock.now = 31  # expired but not purged yet: drop still unindexes them
+    cache.drop("S1")
+
+    assert "S1" not in cache._index
+    assert cache._index == {"S2": {"c"}}